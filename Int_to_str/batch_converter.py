@@ -0,0 +1,114 @@
+import operator
+
+from int_converter import *
+from int_converter import _get_table_word_form, _get_triplet_renderer, _split_triplets
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INT64_MAX = pow(2, 63) - 1
+
+
+def _get_zero_word(gender: str, case: str):
+    return _get_table_word_form(gender=gender, case=case, form_key='е', index=0, table=ONES_TABLE)
+
+
+def _to_int64_array(values):
+    if np is None:
+        return None
+
+    # Приведение сразу к int64 молча отбросило бы дробную часть, поэтому сначала проверяется тип массива.
+    # Дробные, строковые и слишком большие значения уходят в Python-путь, где нецелые отклоняются
+    try:
+        array = np.asarray(values)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    if array.dtype.kind == 'i' or (array.dtype.kind == 'u' and (not array.size or array.max() <= INT64_MAX)):
+        return array.astype(np.int64, copy=False)
+
+    return None
+
+
+def _convert_many_python(values, gender: str, case: str, out):
+    render_triplet = _get_triplet_renderer()
+    zero_word = _get_zero_word(gender=gender, case=case)
+    rendered = {}
+
+    for index, value in enumerate(values):
+        # Как и convert_number_to_words, принимаются только целые: 2.7 - ошибка, а не 2
+        value = operator.index(value)
+        negative = value < 0
+        value = abs(value)
+
+        parts = []
+
+        for scale_index, triplet in enumerate(_split_triplets(value)[:SCALE]):
+            if triplet:
+                key = (triplet, scale_index)
+                words = rendered.get(key)
+
+                if words is None:
+                    triplet_gender = gender if scale_index == 0 else None
+                    words = render_triplet(triplet, triplet_gender, case, scale_index)
+                    rendered[key] = words
+
+                parts.append(words)
+
+        if not parts:
+            out[index] = zero_word
+            continue
+
+        words = ' '.join(reversed(parts))
+        out[index] = "минус " + words if negative else words
+
+    return out
+
+
+def _convert_many_vectorized(values, gender: str, case: str, out):
+    render_triplet = _get_triplet_renderer()
+    zero_word = _get_zero_word(gender=gender, case=case)
+
+    # np.abs(-2**63) переполняет int64, поэтому модуль берётся в uint64: |v| = ~v + 1 для отрицательных
+    negative = values < 0
+    rest = np.where(negative, (~values).astype(np.uint64) + np.uint64(1), values.astype(np.uint64))
+    joined = np.full(len(values), '', dtype=object)
+    scale_index = 0
+
+    while scale_index < SCALE and rest.any():
+        rest, triplets = np.divmod(rest, np.uint64(1000))
+        triplets = triplets.astype(np.intp)
+
+        # Каждый встретившийся триплет разряда переводится один раз
+        lookup = np.full(1000, '', dtype=object)
+        triplet_gender = gender if scale_index == 0 else None
+
+        for triplet in np.flatnonzero(np.bincount(triplets, minlength=1000)).tolist():
+            if triplet:
+                lookup[triplet] = render_triplet(triplet, triplet_gender, case, scale_index) + ' '
+
+        joined = lookup[triplets] + joined
+        scale_index += 1
+
+    joined[negative] = "минус " + joined[negative]
+
+    out[:len(values)] = [words[:-1] or zero_word for words in joined.tolist()]
+
+    return out
+
+
+def convert_many(values, gender: str, case: str, out=None):
+    if out is None:
+        out = [None] * len(values)
+
+    elif len(out) < len(values):
+        raise ValueError("Размер out меньше количества значений")
+
+    array = _to_int64_array(values)
+
+    if array is not None and array.ndim == 1:
+        return _convert_many_vectorized(values=array, gender=gender, case=case, out=out)
+
+    return _convert_many_python(values=values, gender=gender, case=case, out=out)
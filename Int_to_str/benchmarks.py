@@ -0,0 +1,243 @@
+import argparse
+import datetime
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+from batch_converter import *
+from money_converter import *
+from stream_converter import *
+from validator import *
+
+BATCH_SIZES = [10_000, 1_000_000, 10_000_000]
+AMOUNT_SIZE = 1_000_000
+VALUE_LIMIT = pow(1000, 4) - 1 #Суммы до триллиона, помещаются в int64
+
+SCENARIO_SIZE = 10_000
+ROUNDS = 5
+REGRESSION_THRESHOLD = 0.2 #Допустимое падение ops относительно базового замера
+
+MAGNITUDES = {
+    "units": (0, 999),
+    "thousands": (1000, pow(1000, 2) - 1),
+    "millions": (pow(1000, 2), pow(1000, 3) - 1),
+    "billions": (pow(1000, 3), pow(1000, 4) - 1),
+    "max_scale": (pow(1000, SCALE - 1), pow(1000, SCALE) - 1),
+}
+
+
+def _generate_values(size: int, seed: int = 0):
+    limit = VALUE_LIMIT
+
+    if np is not None:
+        return np.random.default_rng(seed).integers(-limit, limit, size=size, dtype=np.int64)
+
+    rng = random.Random(seed)
+    return [rng.randint(-limit, limit) for _ in range(size)]
+
+
+def _generate_range(size: int, low: int, high: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(size)]
+
+
+def _generate_amounts(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [Decimal(rng.randint(0, VALUE_LIMIT)).scaleb(-2) for _ in range(size)]
+
+
+def _measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _get_scenarios(size: int):
+    scenarios = []
+
+    for name, (low, high) in MAGNITUDES.items():
+        values = _generate_range(size, low, high)
+        scenarios.append((f"scalar_{name}", "scalar", {"magnitude": name},
+                          lambda values=values: [convert_number_to_words(value, 'м', 'и') for value in values]))
+
+    mixed_values = _generate_range(size, -VALUE_LIMIT, VALUE_LIMIT)
+
+    for gender in GENDER_LIST:
+        for case in CASE_LIST:
+            scenarios.append((f"scalar_{gender}_{case}", "gender_case", {"gender": gender, "case": case},
+                              lambda gender=gender, case=case: [convert_number_to_words(value, gender, case)
+                                                                for value in mixed_values]))
+
+    raw_values = [str(value) for value in mixed_values]
+    scenarios.append(("validator", "validator", {},
+                      lambda: [validator(value, 'м', 'и') for value in raw_values]))
+
+    batch_values = _generate_values(size)
+    out = [None] * size
+    scenarios.append(("convert_many", "batch", {"numpy": np is not None},
+                      lambda: convert_many(batch_values, 'м', 'и', out=out)))
+
+    raw_lines = [value.encode("utf-8") for value in raw_values]
+    scenarios.append(("validate_many", "validator", {},
+                      lambda: list(validate_many(raw_lines, default_gender='м', default_case='и'))))
+
+    lines = ('\n'.join(raw_values) + '\n').encode("utf-8")
+    scenarios.append(("stream_convert", "batch", {},
+                      lambda: stream_convert(io.BytesIO(lines), io.StringIO(), gender='м', case='и')))
+
+    amounts = _generate_amounts(size)
+    scenarios.append(("convert_amounts_many", "batch", {},
+                      lambda: convert_amounts_many(amounts)))
+
+    return scenarios
+
+
+def _get_stats(times: list, size: int):
+    mean = statistics.mean(times)
+
+    return {
+        "min": min(times),
+        "max": max(times),
+        "mean": mean,
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "median": statistics.median(times),
+        "rounds": len(times),
+        "iterations": size,
+        "ops": size / mean if mean else 0.0,
+    }
+
+
+def run_benchmarks(size: int = SCENARIO_SIZE, rounds: int = ROUNDS):
+    benchmarks = []
+
+    for name, group, params, func in _get_scenarios(size):
+        # Первый прогон прогревает кеш триплетов и не учитывается
+        func()
+        times = [_measure(func) for _ in range(rounds)]
+        benchmarks.append({"name": name, "group": group, "params": params, "stats": _get_stats(times, size)})
+
+    return {
+        "machine_info": {
+            "node": platform.node(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "python_version": platform.python_version(),
+        },
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD):
+    baseline_ops = {benchmark["name"]: benchmark["stats"]["ops"] for benchmark in baseline["benchmarks"]}
+    regressions = []
+
+    for benchmark in current["benchmarks"]:
+        expected = baseline_ops.get(benchmark["name"])
+
+        if not expected:
+            continue
+
+        actual = benchmark["stats"]["ops"]
+
+        if actual < expected * (1 - threshold):
+            regressions.append((benchmark["name"], expected, actual))
+
+    return regressions
+
+
+def benchmark_convert_many(sizes: list, gender: str = 'м', case: str = 'и'):
+    results = []
+
+    for size in sizes:
+        values = _generate_values(size)
+        python_values = values.tolist() if np is not None else values
+        out = [None] * size
+
+        clear_triplet_cache()
+        scalar_time = _measure(
+            lambda: [convert_number_to_words(value=value, gender=gender, case=case) for value in python_values]
+        )
+
+        clear_triplet_cache()
+        batch_time = _measure(lambda: convert_many(values, gender=gender, case=case, out=out))
+
+        results.append((size, scalar_time, batch_time))
+
+    return results
+
+
+def benchmark_amounts(size: int):
+    amounts = _generate_amounts(size)
+    units = [int(amount) for amount in amounts]
+
+    clear_triplet_cache()
+    int_time = _measure(lambda: convert_many(units, gender='м', case='и'))
+
+    clear_triplet_cache()
+    amount_time = _measure(lambda: convert_amounts_many(amounts))
+
+    return int_time, amount_time
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Замеры производительности Int_to_str")
+    parser.add_argument("--size", type=int, default=SCENARIO_SIZE, help="количество значений в сценарии")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="количество замеров сценария")
+    parser.add_argument("--json", help="сохранить результаты в JSON")
+    parser.add_argument("--compare", help="JSON базового замера для проверки регрессий")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="допустимое относительное падение ops")
+    parser.add_argument("--batch-sizes", type=int, nargs="*",
+                        help="сравнить цикл и convert_many на указанных размерах")
+    parser.add_argument("--amounts", type=int, nargs="?", const=AMOUNT_SIZE,
+                        help="сравнить перевод целых и денежных сумм Decimal")
+    return parser.parse_args()
+
+
+def _print_batch_comparison(sizes: list):
+    print(f"numpy: {'да' if np is not None else 'нет'}")
+    print(f"{'Размер':>12} {'Цикл, с':>12} {'convert_many, с':>16} {'Ускорение':>10}")
+
+    for size, scalar_time, batch_time in benchmark_convert_many(sizes):
+        print(f"{size:>12} {scalar_time:>12.3f} {batch_time:>16.3f} {scalar_time / batch_time:>10.2f}")
+
+
+if __name__ == '__main__':
+    args = _parse_args()
+
+    if args.batch_sizes is not None:
+        _print_batch_comparison(args.batch_sizes or BATCH_SIZES)
+        exit(0)
+
+    if args.amounts:
+        int_time, amount_time = benchmark_amounts(args.amounts)
+        print(f"Целые: {int_time:.3f} с, суммы Decimal: {amount_time:.3f} с, {args.amounts} значений")
+        exit(0)
+
+    results = run_benchmarks(size=args.size, rounds=args.rounds)
+
+    for benchmark in results["benchmarks"]:
+        stats = benchmark["stats"]
+        print(f"{benchmark['name']:<20} {stats['ops']:>14.0f} ops/s {stats['mean'] * 1000:>10.2f} мс")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+
+        for name, expected, actual in regressions:
+            print(f"Регрессия {name}: {expected:.0f} -> {actual:.0f} ops/s", file=sys.stderr)
+
+        if regressions:
+            exit(1)
@@ -257,8 +257,68 @@ LEVELS = [
     }
 ]
 
+LARGE_LEVEL_NAMES = ["триллион", "квадриллион", "квинтиллион", "секстиллион",
+                     "септиллион", "октиллион", "нониллион", "дециллион"]
+
+
+def _build_level_forms(name: str):
+    return {
+        "о": {
+            "е": {"и": name, "р": name + "а", "д": name + "у", "в": name,
+                  "т": name + "ом", "п": name + "е"},
+
+            "м": {"и": name + "ы", "р": name + "ов", "д": name + "ам", "в": name + "ы",
+                  "т": name + "ами", "п": name + "ах"}
+        }
+    }
+
+
+LEVELS += [_build_level_forms(name) for name in LARGE_LEVEL_NAMES]
+
+#Валюты: [(род, формы) основной единицы, (род, формы) сотой доли]
+CURRENCIES = {
+    "RUB": [
+        ("м", {
+            "е": {"и": "рубль", "р": "рубля", "д": "рублю", "в": "рубль", "т": "рублём", "п": "рубле"},
+            "м": {"и": "рубли", "р": "рублей", "д": "рублям", "в": "рубли", "т": "рублями", "п": "рублях"}
+        }),
+        ("ж", {
+            "е": {"и": "копейка", "р": "копейки", "д": "копейке", "в": "копейку", "т": "копейкой", "п": "копейке"},
+            "м": {"и": "копейки", "р": "копеек", "д": "копейкам", "в": "копейки", "т": "копейками",
+                  "п": "копейках"}
+        })
+    ],
+    "USD": [
+        ("м", {
+            "е": {"и": "доллар", "р": "доллара", "д": "доллару", "в": "доллар", "т": "долларом", "п": "долларе"},
+            "м": {"и": "доллары", "р": "долларов", "д": "долларам", "в": "доллары", "т": "долларами",
+                  "п": "долларах"}
+        }),
+        ("м", {
+            "е": {"и": "цент", "р": "цента", "д": "центу", "в": "цент", "т": "центом", "п": "центе"},
+            "м": {"и": "центы", "р": "центов", "д": "центам", "в": "центы", "т": "центами", "п": "центах"}
+        })
+    ],
+    "EUR": [
+        ("м", {
+            "е": {"и": "евро", "р": "евро", "д": "евро", "в": "евро", "т": "евро", "п": "евро"},
+            "м": {"и": "евро", "р": "евро", "д": "евро", "в": "евро", "т": "евро", "п": "евро"}
+        }),
+        ("м", {
+            "е": {"и": "цент", "р": "цента", "д": "центу", "в": "цент", "т": "центом", "п": "центе"},
+            "м": {"и": "центы", "р": "центов", "д": "центам", "в": "центы", "т": "центами", "п": "центах"}
+        })
+    ]
+}
+
 CASE_LIST = ["и", "р", "д", "в", "т", "п"]
 
 GENDER_LIST = ["м", "с", "ж"]
 
-SCALE = 4 #Глубина перевода, сколько максимум триплетов будет обработано
+FORM_LIST = ["е", "м"]
+
+SCALE = len(LEVELS) + 1 #Глубина перевода, сколько максимум триплетов будет обработано
+
+TRIPLET_CACHE_SIZE = 1000 * len(CASE_LIST) * (len(GENDER_LIST) + SCALE - 1) #Все возможные триплеты всех разрядов
+
+SMALL_INT_LIMIT = pow(2, 64) #Ниже этой границы триплеты выделяются делением, выше - через str()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from constants import *
 
 
@@ -16,29 +18,58 @@ def _get_word_form(gender: str, case: str, form_key: str, forms: dict):
     return form_values.get(case)
 
 
+GENDER_INDEX = {gender: index for index, gender in enumerate(GENDER_LIST)}
+FORM_INDEX = {form_key: index for index, form_key in enumerate(FORM_LIST)}
+CASE_INDEX = {case: index for index, case in enumerate(CASE_LIST)}
+
+TABLE_STRIDE = len(GENDER_LIST) * len(FORM_LIST) * len(CASE_LIST)
+
+
+def _compile_word_forms(forms_list: list):
+    return tuple(
+        _get_word_form(gender=gender, case=case, form_key=form_key, forms=forms)
+        for forms in forms_list
+        for gender in GENDER_LIST
+        for form_key in FORM_LIST
+        for case in CASE_LIST
+    )
+
+
+ONES_TABLE = _compile_word_forms(ONES)
+TEENS_TABLE = _compile_word_forms(TEENS)
+TENS_TABLE = _compile_word_forms(TENS)
+HUNDREDS_TABLE = _compile_word_forms(HUNDREDS)
+LEVELS_TABLE = _compile_word_forms(LEVELS)
+
+
+def _get_table_offset(gender: str, case: str, form_key: str):
+    return (GENDER_INDEX[gender] * len(FORM_LIST) + FORM_INDEX[form_key]) * len(CASE_LIST) + CASE_INDEX[case]
+
+
+def _get_table_word_form(gender: str, case: str, form_key: str, index: int, table: tuple):
+    return table[index * TABLE_STRIDE + _get_table_offset(gender=gender, case=case, form_key=form_key)]
+
+
 def _get_convert_triplet(triplet: int, gender: str, case: str, form_key: str = 'е'):
     convert_triplet_list = []
+    offset = _get_table_offset(gender=gender, case=case, form_key=form_key)
 
     hundreds = triplet // 100
     tens = triplet % 100
     ones = triplet % 10
 
     if hundreds:
-        convert_triplet_list.append(_get_word_form(gender=gender, case=case,
-                                                   forms=HUNDREDS[hundreds - 1], form_key=form_key))
+        convert_triplet_list.append(HUNDREDS_TABLE[(hundreds - 1) * TABLE_STRIDE + offset])
 
     if 10 <= tens < 20:
-        convert_triplet_list.append(_get_word_form(gender=gender, case=case,
-                                                   forms=TEENS[tens % 10], form_key=form_key))
+        convert_triplet_list.append(TEENS_TABLE[(tens % 10) * TABLE_STRIDE + offset])
 
     else:
         if tens >= 20:
-            convert_triplet_list.append(_get_word_form(gender=gender, case=case,
-                                                       forms=TENS[tens // 10 - 2], form_key=form_key))
+            convert_triplet_list.append(TENS_TABLE[(tens // 10 - 2) * TABLE_STRIDE + offset])
 
         if ones > 0:
-            convert_triplet_list.append(_get_word_form(gender=gender, case=case,
-                                                       forms=ONES[ones], form_key=form_key))
+            convert_triplet_list.append(ONES_TABLE[ones * TABLE_STRIDE + offset])
 
     return convert_triplet_list
 
@@ -81,48 +112,90 @@ def _get_convert_level_triplet(triplet: int, case: str, scale_index: int):
         form_key=level_triplet_key
     )
 
-    level_triplet.append(_get_word_form(
+    level_triplet.append(_get_table_word_form(
         gender=level_gender,
         case=level_case,
-        forms=LEVELS[scale_index - 1],
-        form_key=level_triplet_key
+        form_key=level_triplet_key,
+        index=scale_index - 1,
+        table=LEVELS_TABLE
     ))
 
     return level_triplet
 
 
+def _render_triplet(triplet: int, gender: str, case: str, scale_index: int):
+    if scale_index == 0:
+        triplet_words = _get_convert_triplet(triplet=triplet, gender=gender, case=case)
+
+    else:
+        triplet_words = _get_convert_level_triplet(triplet=triplet, case=case, scale_index=scale_index)
+
+    return ' '.join(triplet_words)
+
+
+_render_cached_triplet = lru_cache(maxsize=TRIPLET_CACHE_SIZE)(_render_triplet)
+_triplet_cache_enabled = True
+
+
+def set_triplet_cache_enabled(enabled: bool):
+    global _triplet_cache_enabled
+
+    _triplet_cache_enabled = enabled
+
+    if not enabled:
+        _render_cached_triplet.cache_clear()
+
+
+def is_triplet_cache_enabled():
+    return _triplet_cache_enabled
+
+
+def get_triplet_cache_info():
+    return _render_cached_triplet.cache_info()
+
+
+def clear_triplet_cache():
+    _render_cached_triplet.cache_clear()
+
+
+def _get_triplet_renderer():
+    return _render_cached_triplet if _triplet_cache_enabled else _render_triplet
+
+
+def _split_triplets(value: int):
+    if value < SMALL_INT_LIMIT:
+        triplets = []
+
+        while value:
+            value, triplet = divmod(value, 1000)
+            triplets.append(triplet)
+
+        return triplets
+
+    # Один проход str() вместо повторных % 1000 и // 1000, квадратичных на больших int
+    digits = str(value)
+    return [int(digits[max(end - 3, 0):end]) for end in range(len(digits), 0, -3)]
+
+
 def convert_number_to_words(value: int, gender: str, case: str):
     parts = []
-    all_parts = []
 
     result = ''
-    scale_index = 0
+    render_triplet = _get_triplet_renderer()
 
     if value == 0:
-        return _get_word_form(gender=gender, case=case, forms=ONES[0], form_key='е')
+        return _get_table_word_form(gender=gender, case=case, form_key='е', index=0, table=ONES_TABLE)
 
     if value < 0:
         result += "минус" + ' '
         value = abs(value)
 
-    while value > 0 and scale_index < SCALE:
-        triplet = value % 1000
-
+    for scale_index, triplet in enumerate(_split_triplets(value)[:SCALE]):
         if triplet:
-            if scale_index == 0:
-                triplet_words = _get_convert_triplet(triplet=triplet, gender=gender, case=case)
-
-            else:
-                triplet_words = _get_convert_level_triplet(triplet=triplet, case=case, scale_index=scale_index)
-
-            parts.append(triplet_words)
-
-        value = value // 1000
-        scale_index += 1
-
-    for part in reversed(parts):
-        all_parts.append(' '.join(part))
+            # Род влияет только на младший триплет, у разрядов он фиксирован
+            triplet_gender = gender if scale_index == 0 else None
+            parts.append(render_triplet(triplet, triplet_gender, case, scale_index))
 
-    result += ' '.join(all_parts)
+    result += ' '.join(reversed(parts))
 
     return result
@@ -1,9 +1,59 @@
+import argparse
+import sys
+import time
+
 from int_converter import *
 from validator import *
+from stream_converter import *
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Перевод целых чисел в слова")
+    parser.add_argument("--stream", action="store_true",
+                        help="неинтерактивный режим: числа построчно из stdin или файла, "
+                             "на месте отклонённой строки пустая строка, номер и код ошибки в stderr")
+    parser.add_argument("--input", help="файл с числами, по умолчанию stdin")
+    parser.add_argument("--csv", action="store_true", help="строки CSV вида число,род,падеж")
+    parser.add_argument("--gender", default="м", help="род по умолчанию")
+    parser.add_argument("--case", default="и", help="падеж по умолчанию")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="размер пакета перевода")
+    parser.add_argument("--no-cache", action="store_true", help="отключить кеш триплетов")
+    return parser.parse_args()
+
+
+def _run_stream(args):
+    _, gender, case = validator(value="0", gender=args.gender, case=args.case)
+
+    if not gender or not case:
+        print("Ошибка: род или падеж по умолчанию не найден.", file=sys.stderr)
+        exit(1)
+
+    if args.no_cache:
+        set_triplet_cache_enabled(False)
+
+    source = open(args.input, "rb") if args.input else sys.stdin.buffer
+    start = time.perf_counter()
+
+    try:
+        processed, rejected = stream_convert(lines=source, output=sys.stdout, gender=gender, case=case,
+                                             csv_mode=args.csv, batch_size=args.batch_size, errors=sys.stderr)
+    finally:
+        if args.input:
+            source.close()
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"Строк: {processed}, отклонено: {rejected}, {rate:.0f} строк/с", file=sys.stderr)
+
 
 if __name__ == '__main__':
+    args = _parse_args()
+
+    if args.stream or args.input:
+        _run_stream(args)
+        exit(0)
 
-    value = input("Введите конвертируемое целое число от 0 до триллиона:")
+    value = input(f"Введите конвертируемое целое число, по модулю меньше 10^{3 * SCALE}:")
     case = input("\nВведите падеж:").strip()
     gender = input("\nВведите род:").strip()
 
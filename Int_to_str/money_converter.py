@@ -0,0 +1,77 @@
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+from batch_converter import *
+from int_converter import _get_triplet_params
+
+DEFAULT_CURRENCY = "RUB"
+CENTS_QUANT = Decimal(1)
+
+
+def _get_noun_form(value: int, case: str, forms: dict):
+    tens = value % 100
+    ones = value % 10
+
+    if 11 <= tens <= 19 or ones == 0:
+        noun_case, form_key = ('р' if case in ['и', 'в'] else case), 'м'
+    else:
+        _, noun_case, form_key = _get_triplet_params(case, ones)
+
+    return forms[form_key][noun_case]
+
+
+@lru_cache(maxsize=None)
+def _get_amount_tables(case: str, currency: str, fraction_as_digits: bool):
+    # Форма существительного зависит только от двух последних цифр, поэтому хватает таблиц на 100 значений
+    (_, unit_forms), (fraction_gender, fraction_forms) = CURRENCIES[currency]
+
+    unit_nouns = tuple(_get_noun_form(value, case, unit_forms) for value in range(100))
+
+    if fraction_as_digits:
+        fraction_words = [f"{value:02d}" for value in range(100)]
+    else:
+        fraction_words = convert_many(list(range(100)), gender=fraction_gender, case=case)
+
+    fraction_parts = tuple(
+        f"{words} {_get_noun_form(value, case, fraction_forms)}" for value, words in enumerate(fraction_words)
+    )
+
+    return unit_nouns, fraction_parts
+
+
+def _split_amount(amount):
+    cents = int((Decimal(amount) * 100).quantize(CENTS_QUANT, rounding=ROUND_HALF_UP))
+    units, fraction = divmod(abs(cents), 100)
+
+    return cents < 0, units, fraction
+
+
+def _join_amount(negative: bool, units: int, units_words: str, fraction: int, unit_nouns: tuple,
+                 fraction_parts: tuple):
+    result = f"{units_words} {unit_nouns[units % 100]} {fraction_parts[fraction]}"
+    return "минус " + result if negative else result
+
+
+def convert_amount_to_words(amount, case: str = 'и', currency: str = DEFAULT_CURRENCY,
+                            fraction_as_digits: bool = False):
+    (unit_gender, _), _ = CURRENCIES[currency]
+    unit_nouns, fraction_parts = _get_amount_tables(case, currency, fraction_as_digits)
+    negative, units, fraction = _split_amount(amount)
+
+    units_words = convert_number_to_words(value=units, gender=unit_gender, case=case)
+
+    return _join_amount(negative, units, units_words, fraction, unit_nouns, fraction_parts)
+
+
+def convert_amounts_many(amounts, case: str = 'и', currency: str = DEFAULT_CURRENCY,
+                         fraction_as_digits: bool = False):
+    (unit_gender, _), _ = CURRENCIES[currency]
+    unit_nouns, fraction_parts = _get_amount_tables(case, currency, fraction_as_digits)
+    split_amounts = [_split_amount(amount) for amount in amounts]
+
+    units_words = convert_many([units for _, units, _ in split_amounts], gender=unit_gender, case=case)
+
+    return [
+        _join_amount(negative, units, words, fraction, unit_nouns, fraction_parts)
+        for (negative, units, fraction), words in zip(split_amounts, units_words)
+    ]
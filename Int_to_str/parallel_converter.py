@@ -0,0 +1,61 @@
+import itertools
+import os
+from collections import deque
+from multiprocessing import Pool
+
+from batch_converter import *
+
+CHUNK_SIZE = 50000
+PENDING_CHUNKS_PER_PROCESS = 2 #Сколько пакетов на процесс может ждать в очереди
+
+
+def _init_worker(cache_enabled: bool):
+    # Таблицы строятся при импорте int_converter, здесь только настраивается кеш процесса
+    set_triplet_cache_enabled(cache_enabled)
+
+
+def _convert_chunk(values, gender: str, case: str):
+    # Результат возвращается одним блоком utf-8 вместо списка Python-строк
+    return '\n'.join(convert_many(values, gender=gender, case=case)).encode('utf-8')
+
+
+def _decode_chunk(data: bytes):
+    return data.decode('utf-8').split('\n')
+
+
+def _iter_chunks(values, chunk_size: int):
+    if np is not None and isinstance(values, np.ndarray):
+        for start in range(0, len(values), chunk_size):
+            yield values[start:start + chunk_size]
+        return
+
+    iterator = iter(values)
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def iter_convert_parallel(values, gender: str, case: str, processes: int = None, chunk_size: int = CHUNK_SIZE):
+    processes = processes or os.cpu_count() or 1
+    max_pending = processes * PENDING_CHUNKS_PER_PROCESS
+    pending = deque()
+
+    with Pool(processes, initializer=_init_worker, initargs=(is_triplet_cache_enabled(),)) as pool:
+        for chunk in _iter_chunks(values, chunk_size):
+            pending.append(pool.apply_async(_convert_chunk, (chunk, gender, case)))
+
+            if len(pending) >= max_pending:
+                yield from _decode_chunk(pending.popleft().get())
+
+        while pending:
+            yield from _decode_chunk(pending.popleft().get())
+
+
+def convert_parallel(values, gender: str, case: str, processes: int = None, chunk_size: int = CHUNK_SIZE):
+    return list(iter_convert_parallel(values, gender=gender, case=case, processes=processes,
+                                      chunk_size=chunk_size))
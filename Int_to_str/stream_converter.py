@@ -0,0 +1,56 @@
+from batch_converter import *
+from validator import *
+
+BATCH_SIZE = 10000
+
+
+def _convert_batch(batch: list):
+    groups = {}
+
+    for position, item in enumerate(batch):
+        # Отклонённая строка остаётся пустой, чтобы строка N вывода соответствовала строке N ввода
+        if item is None:
+            continue
+
+        value, gender, case = item
+        positions, values = groups.setdefault((gender, case), ([], []))
+        positions.append(position)
+        values.append(value)
+
+    result = [''] * len(batch)
+
+    for (gender, case), (positions, values) in groups.items():
+        for position, words in zip(positions, convert_many(values, gender=gender, case=case)):
+            result[position] = words
+
+    return result
+
+
+def stream_convert(lines, output, gender: str, case: str, csv_mode: bool = False, batch_size: int = BATCH_SIZE,
+                   errors=None):
+    processed = 0
+    rejected = 0
+    batch = []
+
+    for result in validate_many(lines, default_gender=gender, default_case=case, csv_mode=csv_mode):
+        processed += 1
+
+        if result.error:
+            rejected += 1
+            batch.append(None)
+
+            if errors is not None:
+                errors.write(f"{processed}: {result.error}\n")
+        else:
+            batch.append((result.value, result.gender, result.case))
+
+        if len(batch) >= batch_size:
+            output.write('\n'.join(_convert_batch(batch)) + '\n')
+            batch.clear()
+
+    if batch:
+        output.write('\n'.join(_convert_batch(batch)) + '\n')
+
+    output.flush()
+
+    return processed, rejected
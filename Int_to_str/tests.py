@@ -1,5 +1,17 @@
+import io
+import random
+
 import pytest
-from int_converter import convert_number_to_words
+from constants import *
+from int_converter import *
+from int_converter import _get_word_form, _get_table_word_form
+from batch_converter import convert_many, np
+from stream_converter import stream_convert
+from parallel_converter import convert_parallel, iter_convert_parallel
+from validator import *
+from benchmarks import VALUE_LIMIT, compare_results
+from word_parser import WORD_FORMS, parse_words_to_number
+from money_converter import convert_amount_to_words, convert_amounts_many
 
 
 def test_zero_all_cases():
@@ -301,5 +313,234 @@ def test_mixed_gender_cases():
     assert convert_number_to_words(1001001, 'с', 'и') == 'один миллион одна тысяча одно'
 
 
+def test_tables_match_dict_forms():
+    """Тест совпадения плоских таблиц со словарями constants"""
+    tables = [
+        (ONES, ONES_TABLE),
+        (TEENS, TEENS_TABLE),
+        (TENS, TENS_TABLE),
+        (HUNDREDS, HUNDREDS_TABLE),
+        (LEVELS, LEVELS_TABLE),
+    ]
+
+    for forms_list, table in tables:
+        assert len(table) == len(forms_list) * TABLE_STRIDE
+
+        for index, forms in enumerate(forms_list):
+            for gender in GENDER_LIST:
+                for form_key in FORM_LIST:
+                    for case in CASE_LIST:
+                        expected = _get_word_form(gender=gender, case=case, form_key=form_key, forms=forms)
+                        actual = _get_table_word_form(gender=gender, case=case, form_key=form_key,
+                                                      index=index, table=table)
+                        assert actual == expected
+
+
+def test_triplet_cache():
+    """Тест кеша триплетов: статистика, очистка и отключение"""
+    clear_triplet_cache()
+    assert get_triplet_cache_info().currsize == 0
+
+    assert convert_number_to_words(123123, 'м', 'и') == 'сто двадцать три тысячи сто двадцать три'
+    misses = get_triplet_cache_info().misses
+
+    assert convert_number_to_words(123123, 'м', 'и') == 'сто двадцать три тысячи сто двадцать три'
+    info = get_triplet_cache_info()
+    assert info.misses == misses
+    assert info.hits >= 2
+
+    set_triplet_cache_enabled(False)
+    try:
+        assert not is_triplet_cache_enabled()
+        assert get_triplet_cache_info().currsize == 0
+        assert convert_number_to_words(2002, 'ж', 'р') == 'двух тысяч двух'
+        assert get_triplet_cache_info().currsize == 0
+    finally:
+        set_triplet_cache_enabled(True)
+
+
+def test_convert_many_matches_scalar():
+    """Тест пакетного перевода против поштучного"""
+    values = [0, 1, -2, 11, 1000, 2002, -123456, 1001001, 999999999999, 5000000, 0, -2 ** 63, 2 ** 63 - 1]
+
+    for gender in GENDER_LIST:
+        for case in CASE_LIST:
+            expected = [convert_number_to_words(value, gender, case) for value in values]
+            assert convert_many(values, gender, case) == expected
+
+
+def test_convert_many_preallocated_out():
+    """Тест записи результата в заранее выделенный список"""
+    out = [None] * 4
+    result = convert_many([3, 21, -1000, 0], 'ж', 'и', out=out)
+
+    assert result is out
+    assert out == ['три', 'двадцать одна', 'минус одна тысяча', 'ноль']
+
+    with pytest.raises(ValueError):
+        convert_many([1, 2], 'м', 'и', out=[None])
+
+
+def test_convert_many_rejects_non_integers():
+    """Тест отказа на дробных значениях вместо отбрасывания дробной части"""
+    with pytest.raises(TypeError):
+        convert_many([1, 2.7], 'м', 'и')
+
+    assert convert_many([-1, pow(2, 63)], 'м', 'и')[0] == 'минус один'
+    assert convert_many([], 'м', 'и') == []
+
+    if np is not None:
+        with pytest.raises(TypeError):
+            convert_many(np.array([2.7, 3.0]), 'м', 'и')
+
+        assert convert_many(np.array([2, 3], dtype=np.uint8), 'м', 'и') == ['два', 'три']
+
+
+def test_stream_convert():
+    """Тест потокового перевода построчно и в формате CSV"""
+    output = io.StringIO()
+    errors = io.StringIO()
+    processed, rejected = stream_convert(io.StringIO("12\nabc\n-5\n\n"), output, gender='ж', case='р',
+                                         batch_size=1, errors=errors)
+
+    assert (processed, rejected) == (4, 2)
+    assert output.getvalue() == "двенадцати\n\nминус пяти\n\n"
+    assert errors.getvalue() == f"2: {ERROR_NOT_INT}\n4: {ERROR_EMPTY}\n"
+
+    output = io.StringIO()
+    processed, rejected = stream_convert(io.StringIO("1,ж,р\n2,с\nx,м,и\n21,,т\n"), output, gender='м', case='и',
+                                         csv_mode=True)
+
+    assert (processed, rejected) == (4, 1)
+    assert output.getvalue() == "одной\nдва\n\nдвадцатью одним\n"
+
+    output = io.StringIO()
+    processed, rejected = stream_convert(io.StringIO("1\n2\n"), output, gender='x', case='и')
+
+    assert (processed, rejected) == (2, 2)
+    assert output.getvalue() == "\n\n"
+
+
+def test_large_scales():
+    """Тест разрядов от триллиона до дециллиона"""
+    assert convert_number_to_words(10 ** 12, 'м', 'и') == 'один триллион'
+    assert convert_number_to_words(2 * 10 ** 15, 'м', 'и') == 'два квадриллиона'
+    assert convert_number_to_words(5 * 10 ** 18, 'м', 'р') == 'пяти квинтиллионов'
+    assert convert_number_to_words(21 * 10 ** 21, 'м', 'т') == 'двадцатью одним секстиллионом'
+    assert convert_number_to_words(11 * 10 ** 24, 'м', 'и') == 'одиннадцать септиллионов'
+    assert convert_number_to_words(3 * 10 ** 27, 'м', 'п') == 'трёх октиллионах'
+    assert convert_number_to_words(10 ** 30, 'м', 'д') == 'одному нониллиону'
+    assert convert_number_to_words(10 ** 33 + 1, 'ж', 'и') == 'один дециллион одна'
+
+    assert convert_number_to_words(-(10 ** 33 + 2 * 10 ** 12), 'м', 'и') == 'минус один дециллион два триллиона'
+
+
+def test_validator_scale_limit():
+    """Тест границы допустимых значений"""
+    limit = pow(1000, SCALE)
+
+    assert validator(str(limit - 1), 'м', 'и')[0] == limit - 1
+    assert validator(str(-(limit - 1)), 'м', 'и')[0] == -(limit - 1)
+    assert validator(str(limit), 'м', 'и')[0] is None
+    assert validator("abc", 'м', 'и')[0] is None
+
+
+def test_convert_parallel_keeps_order():
+    """Тест параллельного перевода: порядок и совпадение с поштучным"""
+    values = list(range(-50, 2000, 7)) + [10 ** 33 + 1]
+    expected = [convert_number_to_words(value, 'ж', 'т') for value in values]
+
+    assert convert_parallel(values, 'ж', 'т', processes=2, chunk_size=16) == expected
+    assert list(iter_convert_parallel(iter(values), 'ж', 'т', processes=2, chunk_size=50)) == expected
+    assert convert_parallel([], 'м', 'и', processes=1) == []
+
+
+def test_validate_line_bytes():
+    """Тест быстрой проверки строк bytes/memoryview"""
+    assert validate_line(b" 42\n", 'м', 'и') == ValidationResult(42, 'м', 'и')
+    assert validate_line(memoryview(b"-7,\xd0\x96,\xd0\xb4"), 'м', 'и', csv_mode=True) == ValidationResult(-7, 'ж', 'д')
+    assert validate_line('"5","с"', 'м', 'т', csv_mode=True) == ValidationResult(5, 'с', 'т')
+
+    assert validate_line(b"", 'м', 'и').error == ERROR_EMPTY
+    assert validate_line(b"12a", 'м', 'и').error == ERROR_NOT_INT
+    assert validate_line(b"1" * (MAX_VALUE_DIGITS + 1), 'м', 'и').error == ERROR_OUT_OF_RANGE
+    assert validate_line(b"0" * 50 + b"1", 'м', 'и').value == 1
+    assert validate_line("1,x", 'м', 'и', csv_mode=True).error == ERROR_GENDER
+    assert validate_line(bytearray(b"3"), 'М', 'и') == ValidationResult(3, 'м', 'и')
+    assert [result.error for result in validate_many([b"1", b"z"], 'м', 'q')] == [ERROR_CASE, ERROR_NOT_INT]
+    assert validate_line("1,м,q", 'м', 'и', csv_mode=True).error == ERROR_CASE
+
+
+def test_benchmark_regression_gate():
+    """Тест проверки регрессий производительности"""
+    baseline = {"benchmarks": [{"name": "a", "stats": {"ops": 1000.0}},
+                               {"name": "b", "stats": {"ops": 1000.0}}]}
+    current = {"benchmarks": [{"name": "a", "stats": {"ops": 850.0}},
+                              {"name": "b", "stats": {"ops": 700.0}},
+                              {"name": "c", "stats": {"ops": 1.0}}]}
+
+    assert compare_results(current, baseline, threshold=0.2) == [("b", 1000.0, 700.0)]
+    assert compare_results(current, baseline, threshold=0.5) == []
+
+
+def test_amount_to_words():
+    """Тест денежных сумм с копейками"""
+    assert convert_amount_to_words('123.45') == 'сто двадцать три рубля сорок пять копеек'
+    assert convert_amount_to_words('123.45', 'р') == 'ста двадцати трёх рублей сорока пяти копеек'
+    assert convert_amount_to_words('21.21', 'в') == 'двадцать один рубль двадцать одну копейку'
+    assert convert_amount_to_words('11.11') == 'одиннадцать рублей одиннадцать копеек'
+    assert convert_amount_to_words('1000') == 'одна тысяча рублей ноль копеек'
+    assert convert_amount_to_words('-3.999') == 'минус четыре рубля ноль копеек'
+    assert convert_amount_to_words('2.02', 'т', 'USD') == 'двумя долларами двумя центами'
+    assert convert_amount_to_words('5.07', fraction_as_digits=True) == 'пять рублей 07 копеек'
+
+
+def test_amounts_many_matches_scalar():
+    """Тест пакетного перевода сумм против поштучного"""
+    amounts = ['0', '0.01', '1.5', '2.22', '-15.05', '1000001.99', '123456789.10']
+
+    for case in CASE_LIST:
+        expected = [convert_amount_to_words(amount, case) for amount in amounts]
+        assert convert_amounts_many(amounts, case) == expected
+
+
+ROUNDTRIP_SAMPLES = 100_000
+
+
+def test_parse_words_to_number():
+    """Тест разбора чисел, записанных словами"""
+    assert parse_words_to_number('ноль') == 0
+    assert parse_words_to_number('Сто Двадцать Три') == 123
+    assert parse_words_to_number('тысяча двести') == 1200
+    assert parse_words_to_number('минус двух тысяч двух') == -2002
+    assert parse_words_to_number('одного дециллиона') == 10 ** 33
+
+    assert parse_words_to_number('') is None
+    assert parse_words_to_number('двадцать двадцать') is None
+    assert parse_words_to_number('один два') is None
+    assert parse_words_to_number('сто тысяч миллион') is None
+    assert parse_words_to_number('минус ноль') is None
+    assert parse_words_to_number('пять рублей') is None
+
+
+def test_word_forms_are_unambiguous():
+    """Тест: каждая словоформа соответствует одному значению"""
+    for word, (place, entries) in WORD_FORMS.items():
+        assert len({value for value, scale, gender, case in entries}) == 1, word
+
+
+def test_parse_roundtrip_random():
+    """Тест обратного разбора на случайных числах всех родов и падежей"""
+    rng = random.Random(42)
+    limit = pow(1000, SCALE) - 1
+
+    for _ in range(ROUNDTRIP_SAMPLES):
+        value = rng.choice([rng.randint(0, 1000), rng.randint(-VALUE_LIMIT, VALUE_LIMIT), rng.randint(-limit, limit)])
+        gender = rng.choice(GENDER_LIST)
+        case = rng.choice(CASE_LIST)
+
+        assert parse_words_to_number(convert_number_to_words(value, gender, case)) == value
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
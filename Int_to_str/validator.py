@@ -1,16 +1,52 @@
+from typing import NamedTuple
+
 from constants import *
 
+MAX_VALUE = pow(1000, SCALE)
+MAX_VALUE_DIGITS = 3 * SCALE #Больше цифр без ведущих нулей быть не может, проверяется до int()
+
+ERROR_EMPTY = "empty"
+ERROR_NOT_INT = "not_int"
+ERROR_OUT_OF_RANGE = "out_of_range"
+ERROR_GENDER = "gender"
+ERROR_CASE = "case"
+
+FIELD_SEPARATOR = b","
+STRIP_BYTES = b" \t\r\n\"'"
+
+
+class ValidationResult(NamedTuple):
+    value: int = None
+    gender: str = None
+    case: str = None
+    error: str = None
+
+
+def _build_byte_table(validate_list: list):
+    # Кириллица в utf-8 занимает два байта, поэтому ключ - первые два байта поля
+    table = {}
+
+    for char in validate_list:
+        table[char.encode("utf-8")] = char
+        table[char.upper().encode("utf-8")] = char
+
+    return table
+
+
+GENDER_BYTES = _build_byte_table(GENDER_LIST)
+CASE_BYTES = _build_byte_table(CASE_LIST)
+
 
 def _validate_input_int(value: str):
     if not value or not isinstance(value, str):
         return None
-    print(int(value))
+
     try:
         convert_value = int(value)
     except ValueError:
         return None
 
-    if abs(convert_value) > pow(1000, SCALE):
+    if abs(convert_value) >= pow(1000, SCALE):
         return None
 
     return convert_value
@@ -38,3 +74,105 @@ def validator(value: str, gender: str, case: str):
     validated_case = _validate_input_str(value=case, validate_list=CASE_LIST)
 
     return validated_input, validated_gender, validated_case
+
+
+def _to_bytes(value):
+    # bytes и bytearray разбираются как есть; memoryview и прочие буферы копируются в bytes,
+    # так как у memoryview нет strip/split
+    if isinstance(value, (bytes, bytearray)):
+        return value
+
+    if isinstance(value, str):
+        return value.encode("utf-8")
+
+    return bytes(value)
+
+
+def _validate_bytes_int(value: bytes):
+    value = value.strip(STRIP_BYTES)
+
+    if not value:
+        return None, ERROR_EMPTY
+
+    # Длина проверяется до int(), ведущие нули отбрасываются только для длинных строк
+    if len(value) > MAX_VALUE_DIGITS + 1 and len(value.lstrip(b"+-").lstrip(b"0")) > MAX_VALUE_DIGITS:
+        return None, ERROR_OUT_OF_RANGE
+
+    try:
+        convert_value = int(value)
+    except ValueError:
+        return None, ERROR_NOT_INT
+
+    if not -MAX_VALUE < convert_value < MAX_VALUE:
+        return None, ERROR_OUT_OF_RANGE
+
+    return convert_value, None
+
+
+def _validate_bytes_str(value: bytes, table: dict, default: str):
+    value = value.strip(STRIP_BYTES)
+
+    if not value:
+        return default
+
+    return table.get(value[:2])
+
+
+def validate_fields(value, gender=b"", case=b"", default_gender: str = None, default_case: str = None):
+    convert_value, error = _validate_bytes_int(_to_bytes(value))
+
+    if error:
+        return ValidationResult(error=error)
+
+    validated_gender = _validate_bytes_str(_to_bytes(gender), GENDER_BYTES, default_gender)
+
+    if not validated_gender:
+        return ValidationResult(value=convert_value, error=ERROR_GENDER)
+
+    validated_case = _validate_bytes_str(_to_bytes(case), CASE_BYTES, default_case)
+
+    if not validated_case:
+        return ValidationResult(value=convert_value, gender=validated_gender, error=ERROR_CASE)
+
+    return ValidationResult(value=convert_value, gender=validated_gender, case=validated_case)
+
+
+def _validate_defaults(default_gender: str, default_case: str):
+    # Род и падеж по умолчанию проверяются один раз; неверные отклоняют строку, а не роняют перевод
+    return (_validate_input_str(value=default_gender, validate_list=GENDER_LIST),
+            _validate_input_str(value=default_case, validate_list=CASE_LIST))
+
+
+def validate_line(line, default_gender: str, default_case: str, csv_mode: bool = False):
+    line = _to_bytes(line)
+    default_gender, default_case = _validate_defaults(default_gender, default_case)
+
+    if not csv_mode:
+        return validate_fields(line, default_gender=default_gender, default_case=default_case)
+
+    value, gender, case = (line.split(FIELD_SEPARATOR, 2) + [b"", b""])[:3]
+
+    return validate_fields(value, gender, case, default_gender=default_gender, default_case=default_case)
+
+
+def validate_many(lines, default_gender: str, default_case: str, csv_mode: bool = False):
+    default_gender, default_case = _validate_defaults(default_gender, default_case)
+
+    if csv_mode:
+        for line in lines:
+            value, gender, case = (_to_bytes(line).split(FIELD_SEPARATOR, 2) + [b"", b""])[:3]
+            yield validate_fields(value, gender, case, default_gender=default_gender, default_case=default_case)
+        return
+
+    # Без CSV род и падеж общие для всех строк, проверяется только число
+    for line in lines:
+        value, error = _validate_bytes_int(_to_bytes(line))
+
+        if error:
+            yield ValidationResult(error=error)
+        elif not default_gender:
+            yield ValidationResult(value=value, error=ERROR_GENDER)
+        elif not default_case:
+            yield ValidationResult(value=value, gender=default_gender, error=ERROR_CASE)
+        else:
+            yield ValidationResult(value, default_gender, default_case)
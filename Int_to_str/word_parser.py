@@ -0,0 +1,95 @@
+from int_converter import *
+from int_converter import _get_table_offset
+
+# Классы позиций внутри триплета: сотни, десятки, единицы (и 10-19)
+HUNDREDS_PLACE = 3
+TENS_PLACE = 2
+ONES_PLACE = 1
+LEVEL_PLACE = 4
+
+MINUS_WORD = "минус"
+
+
+def _add_table_forms(word_forms: dict, table: tuple, values: list, place: int):
+    for index, (value, scale) in enumerate(values):
+        for gender in GENDER_LIST:
+            for form_key in FORM_LIST:
+                for case in CASE_LIST:
+                    word = table[index * TABLE_STRIDE + _get_table_offset(gender=gender, case=case,
+                                                                           form_key=form_key)]
+                    entry = (value, scale, gender, case)
+                    entries = word_forms.setdefault(word, [place])
+
+                    if entry not in entries:
+                        entries.append(entry)
+
+
+def _build_word_forms():
+    word_forms = {}
+
+    _add_table_forms(word_forms, ONES_TABLE, [(value, 0) for value in range(10)], place=ONES_PLACE)
+    _add_table_forms(word_forms, TEENS_TABLE, [(value, 0) for value in range(10, 20)], place=ONES_PLACE)
+    _add_table_forms(word_forms, TENS_TABLE, [(value, 0) for value in range(20, 100, 10)], place=TENS_PLACE)
+    _add_table_forms(word_forms, HUNDREDS_TABLE, [(value, 0) for value in range(100, 1000, 100)],
+                     place=HUNDREDS_PLACE)
+    _add_table_forms(word_forms, LEVELS_TABLE, [(pow(1000, scale), scale) for scale in range(1, len(LEVELS) + 1)],
+                     place=LEVEL_PLACE)
+
+    # Первый элемент - класс позиции, далее все варианты (значение, разряд, род, падеж)
+    return {word: (entries[0], tuple(entries[1:])) for word, entries in word_forms.items()}
+
+
+WORD_FORMS = _build_word_forms()
+ZERO_FORMS = frozenset(word for word, (_, entries) in WORD_FORMS.items() if entries[0][0] == 0)
+
+
+def parse_words_to_number(text: str):
+    if not text or not isinstance(text, str):
+        return None
+
+    tokens = text.lower().split()
+    negative = bool(tokens) and tokens[0] == MINUS_WORD
+
+    if negative:
+        tokens = tokens[1:]
+
+    if not tokens:
+        return None
+
+    if len(tokens) == 1 and tokens[0] in ZERO_FORMS:
+        return None if negative else 0
+
+    total = 0
+    triplet = 0
+    last_place = LEVEL_PLACE
+    last_level = None
+
+    for token in tokens:
+        word = WORD_FORMS.get(token)
+
+        if word is None:
+            return None
+
+        place, entries = word
+        value = entries[0][0]
+
+        if place == LEVEL_PLACE:
+            # Разряды идут строго по убыванию, пустой триплет перед разрядом означает единицу
+            if last_level is not None and value >= last_level:
+                return None
+
+            total += (triplet or 1) * value
+            triplet = 0
+            last_place = LEVEL_PLACE
+            last_level = value
+            continue
+
+        if value == 0 or place >= last_place:
+            return None
+
+        triplet += value
+        last_place = place
+
+    total += triplet
+
+    return -total if negative else total
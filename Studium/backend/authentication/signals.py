@@ -1,10 +1,13 @@
 import logging
 from django.db.models.signals import post_save
+from django.db import transaction
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from .models import Client
-from ready_tasks.models import ReadyTask
+from ready_tasks.models import ReadyTask, ReadyTaskFacetCount
+from studium_backend.facets import subtract_facet_counts
+from studium_backend.response_cache import bump_catalog_version
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -31,4 +34,10 @@ def add_user_to_client_group(sender, instance, created, **kwargs):
 def ban_client_tasks(sender, instance, created, **kwargs):
     if instance.is_banned:
         if instance.user:
-            ReadyTask.objects.filter(owner=instance.user, status='active').update(status='unpublished')
+            active_tasks = ReadyTask.objects.filter(owner=instance.user, status='active')
+
+            # update() идёт мимо сигналов, поэтому фасеты каталога вычитаются здесь же
+            with transaction.atomic():
+                subtract_facet_counts(ReadyTaskFacetCount, active_tasks)
+                if active_tasks.update(status='unpublished'):
+                    bump_catalog_version(ReadyTask)
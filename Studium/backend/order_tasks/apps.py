@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class OrderTasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'order_tasks'
+
+    def ready(self):
+        import order_tasks.signals
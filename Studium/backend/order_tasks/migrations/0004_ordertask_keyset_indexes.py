@@ -0,0 +1,25 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order_tasks', '0003_ordertask_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ordertask',
+            index=models.Index(fields=['views', 'id'], name='order_task_views_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ordertask',
+            index=models.Index(fields=['price', 'id'], name='order_task_price_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ordertask',
+            index=models.Index(fields=['name', 'id'], name='order_task_name_id_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
-from django.db import models
-from django.db.models import F
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from authentication.models import CustomUser
+from studium_backend.facets import FACET_CHOICES
+from studium_backend.view_counter import view_counter
 
 
 class OrderTask(models.Model):
@@ -39,15 +42,19 @@ class OrderTask(models.Model):
 
     views = models.PositiveIntegerField(default=0)
 
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        # pre_save читает фасеты строки, post_save переносит разницу в сводную таблицу - в одной транзакции
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def get_latest_version(self):
-        latest = self
-        while latest.new_versions.exists():
-            latest = latest.new_versions.last()
-        return latest
+        # Задания обновляются на месте (_update_task), цепочки версий у них нет
+        return self
 
     def increment_views(self):
-        self.__class__.objects.filter(pk=self.pk).update(views=F('views') + 1)
-        self.refresh_from_db(fields=['views'])
+        self.views = view_counter.increment(self)
         return self.views
 
     def __str__(self):
@@ -57,6 +64,26 @@ class OrderTask(models.Model):
         ordering = ['-publish_date']
         verbose_name = 'Задание'
         verbose_name_plural = 'Задания'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='order_task_search_idx'),
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='order_task_name_trgm_idx'),
+            # Ключи keyset-пагинации: поле сортировки каталога и id
+            models.Index(fields=['views', 'id'], name='order_task_views_id_idx'),
+            models.Index(fields=['price', 'id'], name='order_task_price_id_idx'),
+            models.Index(fields=['name', 'id'], name='order_task_name_id_idx'),
+        ]
+
+
+class OrderTaskFacetCount(models.Model):
+    """Сводная таблица фасетов каталога: количество активных заданий по значению фильтра."""
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=200)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['facet', 'value'], name='order_task_facet_count_unique'),
+        ]
 
 
 class Files(models.Model):
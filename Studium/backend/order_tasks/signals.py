@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from order_tasks.models import OrderTask, OrderTaskFacetCount
+from studium_backend.count_service import CountService
+from studium_backend.facets import remember_facet_values, update_facet_summary
+from studium_backend.response_cache import bump_catalog_version
+from studium_backend.search import is_search_update, update_search_vector
+
+
+count_service = CountService()
+
+
+@receiver(post_save, sender=OrderTask)
+def signal_task_update_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    if is_search_update(created, update_fields):
+        update_search_vector(OrderTask, instance.pk)
+
+
+@receiver(post_save, sender=OrderTask)
+@receiver(post_delete, sender=OrderTask)
+def signal_task_invalidate_counts(sender, instance, update_fields=None, **kwargs):
+    # Просмотры не влияют на состав выборок каталога
+    if update_fields and set(update_fields) <= {"views"}:
+        return
+
+    count_service.invalidate(OrderTask)
+
+
+@receiver(pre_save, sender=OrderTask)
+def signal_task_bump_catalog_version(sender, instance, **kwargs):
+    if instance.pk is None:
+        return
+
+    old_status = OrderTask.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+    if old_status != instance.status:
+        bump_catalog_version(OrderTask)
+
+
+@receiver(post_delete, sender=OrderTask)
+def signal_task_bump_catalog_version_on_delete(sender, instance, **kwargs):
+    bump_catalog_version(OrderTask)
+
+
+@receiver(pre_save, sender=OrderTask)
+def signal_task_remember_facets(sender, instance, update_fields=None, **kwargs):
+    remember_facet_values(instance, update_fields)
+
+
+@receiver(post_save, sender=OrderTask)
+def signal_task_update_facets(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"views"}:
+        return
+
+    update_facet_summary(OrderTaskFacetCount, instance)
+
+
+@receiver(post_delete, sender=OrderTask)
+def signal_task_update_facets_on_delete(sender, instance, **kwargs):
+    update_facet_summary(OrderTaskFacetCount, instance, deleted=True)
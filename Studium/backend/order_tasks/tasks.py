@@ -6,7 +6,7 @@ from celery import shared_task
 from authentication.models import CustomUser
 from notifications.decorators import notify_on_task_failure
 from storage.validate_upload_file_mixin import ValidateUploadFileMixin
-from .models import OrderTask, Files
+from .models import OrderTask, OrderTaskFacetCount, Files
 from .serializers import OrderTaskCreateSerializer, FilesSerializer
 from storage.object_storage import S3Client
 from studium_backend.settings import (
@@ -16,6 +16,8 @@ from studium_backend.settings import (
     AWS_SECRET_ACCESS_KEY,
 )
 from filters.validator import TextValidator
+from studium_backend.facets import rebuild_facet_summary
+from studium_backend.view_counter import view_counter
 
 logger = logging.getLogger("django")
 
@@ -179,6 +181,21 @@ def create_order_task_with_files(task_data: dict):
         raise
 
 
+@shared_task
+def flush_order_task_views():
+    flushed = view_counter.flush(OrderTask)
+    if flushed:
+        logger.info(f"Перенесены просмотры {flushed} заданий")
+    return flushed
+
+
+@shared_task
+def rebuild_order_task_facets():
+    rebuilt = rebuild_facet_summary(OrderTask, OrderTaskFacetCount)
+    logger.info(f"Пересчитаны фасеты каталога заданий: {rebuilt} значений")
+    return rebuilt
+
+
 @shared_task
 def move_file_between_folders(task_id):
     try:
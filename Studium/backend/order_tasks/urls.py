@@ -4,6 +4,7 @@ from .views import *
 urlpatterns = [
     path('cr/', OrderTaskCreateAPIView.as_view()),
     path('all/', OrderTaskListAPIView.as_view()),
+    path('facets/', OrderTaskFacetsAPIView.as_view()),
     # path('sold/<int:pk>/', ReadyTaskSoldListAPIView.as_view()),
     # path('bought/me/', ReadyTaskBoughtListAPIView.as_view()),
     path('<int:pk>/', OrderTaskDetailAPIView.as_view()),
@@ -1,4 +1,5 @@
 import json
+import logging
 
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -6,15 +7,22 @@ from rest_framework.response import Response
 from rest_framework import generics, status
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from studium_backend.count_service import CountService, CountedPaginator
 from studium_backend.decorators import catch_and_log_exceptions
 from studium_backend.exceptions import AppException
+from studium_backend.facets import format_facets, get_facet_counts, get_summary_counts, has_catalog_filters
+from studium_backend.pagination import is_cursor_request, paginate_by_cursor
+from studium_backend.response_cache import cache_anonymous_response
+from studium_backend.search import apply_search, get_search_text
 
 from .serializers import *
+from .models import OrderTaskFacetCount
 from .tasks import create_order_task_with_files
 
-from django.core.paginator import Paginator
 from storage.mixins import  PublicGetMixin
 
+logger = logging.getLogger(__name__)
+
 
 class OrderTaskCreateAPIView(generics.CreateAPIView):
     serializer_class = OrderTaskCreateSerializer
@@ -190,6 +198,7 @@ class OrderTaskCreateAPIView(generics.CreateAPIView):
 class OrderTaskListAPIView(generics.ListAPIView):
     serializer_class = ShortInfoOrderTaskSerializer
     permission_classes = (AllowAny,)
+    count_service = CountService()
 
     SORT_MAP = {
         "По популярности": "-views",
@@ -231,21 +240,31 @@ class OrderTaskListAPIView(generics.ListAPIView):
                         print(f"Filtering by {field}__{lookup_type}={value}")
                         queryset = queryset.filter(**{f"{field}__{lookup_type}": value})
 
+        queryset = apply_search(queryset, get_search_text(search_data), order_by_rank=sort_value not in self.SORT_MAP)
+
         print("Final queryset SQL:", queryset.query)
         return queryset
 
+    @cache_anonymous_response(OrderTask)
     @catch_and_log_exceptions
     def get(self, request, *args, **kwargs):
         print("==> OrderTaskListAPIView.get() called")
         queryset = self.get_queryset()
-        total_count = queryset.count()
-        print("Total count:", total_count)
+
+        if is_cursor_request(request.query_params):
+            rows, page_info = paginate_by_cursor(queryset, request.query_params, self.count_service)
+            serializer = self.get_serializer(rows, many=True)
+            logger.debug("Cursor page: %s rows, %s", len(serializer.data), page_info)
+            return Response({"page_data": serializer.data, **page_info})
 
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", 10))
         print(f"Pagination: page={page}, page_size={page_size}")
 
-        paginator = Paginator(queryset, page_size)
+        total_count, is_estimate = self.count_service.get_count(queryset)
+        print("Total count:", total_count, "estimate:", is_estimate)
+
+        paginator = CountedPaginator(queryset, page_size, total_count)
         paginated_queryset = paginator.page(page)
 
         serializer = self.get_serializer(paginated_queryset, many=True)
@@ -253,12 +272,27 @@ class OrderTaskListAPIView(generics.ListAPIView):
 
         return Response({
             "total_count": total_count,
+            "total_count_is_estimate": is_estimate,
             "page_data": serializer.data,
             "has_next": paginated_queryset.has_next(),
             "has_previous": paginated_queryset.has_previous(),
         })
 
 
+
+class OrderTaskFacetsAPIView(OrderTaskListAPIView):
+    """Количество заданий по типу, дисциплине, университету и уровню для текущих фильтров каталога."""
+
+    @catch_and_log_exceptions
+    def get(self, request, *args, **kwargs):
+        if has_catalog_filters(request.query_params, self.SEARCH_FIELDS):
+            counts = get_facet_counts(self.get_queryset())
+        else:
+            counts = get_summary_counts(OrderTaskFacetCount)
+
+        return Response(format_facets(counts), status=status.HTTP_200_OK)
+
+
 class OrderTaskDetailAPIView(generics.RetrieveAPIView, PublicGetMixin):
     queryset = OrderTask.objects.all()
     serializer_class = OrderTaskCreateSerializer
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Wallet, Transaction, FrozenFunds, PurchasedReadyTask, SlotsPurchase, SlotPackage, Bank
+from .models import Wallet, Transaction, FrozenFunds, PurchasedReadyTask, ReadyTaskAccess, SlotsPurchase, SlotPackage, Bank
 
 
 @admin.register(Bank)
@@ -132,6 +132,14 @@ class PurchasedReadyTaskAdmin(admin.ModelAdmin):
                            "ready_task")
 
 
+@admin.register(ReadyTaskAccess)
+class ReadyTaskAccessAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "ready_task", "access_kind", "purchase", "created_at")
+    list_filter = ("access_kind", "created_at")
+    search_fields = ("user__email", "ready_task__id")
+    list_select_related = ("user", "ready_task", "purchase")
+
+
 @admin.register(SlotsPurchase)
 class SlotsPurchaseAdmin(admin.ModelAdmin):
     list_display = ("id", "transaction", "count_slots", "status", "created_at")
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_ready_task_access(apps, schema_editor):
+    purchase_model = apps.get_model('payments', 'PurchasedReadyTask')
+    access_model = apps.get_model('payments', 'ReadyTaskAccess')
+
+    purchases = (
+        purchase_model.objects
+        .filter(models.Q(status='paid') | models.Q(status='refunded', is_gift=True))
+        .order_by('-created_at')
+        .values_list('id', 'buyer_transaction__wallet__user_id', 'ready_task_id', 'status')
+    )
+
+    # Для повторных покупок одной работы остаётся последняя запись
+    accesses = {}
+    for purchase_id, user_id, ready_task_id, status in purchases.iterator():
+        accesses.setdefault((user_id, ready_task_id), access_model(
+            user_id=user_id,
+            ready_task_id=ready_task_id,
+            purchase_id=purchase_id,
+            access_kind='purchase' if status == 'paid' else 'gift',
+        ))
+
+    access_model.objects.bulk_create(accesses.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ready_tasks', '0003_readytask_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('payments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadyTaskAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_kind', models.CharField(choices=[('purchase', 'Покупка'), ('gift', 'Оставлена после возврата')], default='purchase', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('purchase', models.ForeignKey(blank=True, help_text='Покупка, по которой выдан доступ', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='accesses', to='payments.purchasedreadytask')),
+                ('ready_task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accesses', to='ready_tasks.readytask')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ready_task_accesses', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Доступ к работе',
+                'verbose_name_plural': 'Доступы к работам',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='ready_task_access_user_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='readytaskaccess',
+            constraint=models.UniqueConstraint(fields=('user', 'ready_task'), name='unique_ready_task_access'),
+        ),
+        migrations.RunPython(fill_ready_task_access, migrations.RunPython.noop),
+    ]
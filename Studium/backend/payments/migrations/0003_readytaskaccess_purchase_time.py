@@ -0,0 +1,33 @@
+# Generated by Django 4.2.18 on 2026-10-18 08:09
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def copy_purchase_time(apps, schema_editor):
+    purchase_model = apps.get_model('payments', 'PurchasedReadyTask')
+    access_model = apps.get_model('payments', 'ReadyTaskAccess')
+
+    # Перенесённые в 0002 доступы получили время миграции из auto_now_add, возвращается время покупки
+    purchase_time = purchase_model.objects.filter(pk=models.OuterRef('purchase_id')).values('created_at')[:1]
+    access_model.objects.filter(purchase__isnull=False).update(created_at=models.Subquery(purchase_time))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_readytaskaccess'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='readytaskaccess',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': 'Доступ к работе', 'verbose_name_plural': 'Доступы к работам'},
+        ),
+        migrations.AlterField(
+            model_name='readytaskaccess',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(copy_purchase_time, migrations.RunPython.noop),
+    ]
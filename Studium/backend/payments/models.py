@@ -174,6 +174,62 @@ class PurchasedReadyTask(models.Model):
         self.save(update_fields=["status"])
 
 
+class ReadyTaskAccess(models.Model):
+    """
+    Права покупателя на работу: одна строка на пару (пользователь, работа), чтобы проверка владения
+    была одним обращением к уникальному индексу вместо цепочки покупка -> транзакция -> кошелёк.
+    """
+    ACCESS_KIND_CHOICES = [
+        ('purchase', 'Покупка'),
+        ('gift', 'Оставлена после возврата'),
+    ]
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="ready_task_accesses")
+
+    ready_task = models.ForeignKey(ReadyTask, on_delete=models.CASCADE, related_name="accesses")
+
+    access_kind = models.CharField(max_length=20, choices=ACCESS_KIND_CHOICES, default='purchase')
+
+    purchase = models.ForeignKey(PurchasedReadyTask, on_delete=models.SET_NULL, null=True, blank=True,
+                                 related_name="accesses", help_text="Покупка, по которой выдан доступ")
+
+    # default, а не auto_now_add: при переносе старых покупок сохраняется время покупки
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        verbose_name = "Доступ к работе"
+        verbose_name_plural = "Доступы к работам"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "ready_task"], name="unique_ready_task_access"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="ready_task_access_user_idx"),
+        ]
+
+    @classmethod
+    def has_access(cls, user_id, ready_task_id):
+        return cls.objects.filter(user_id=user_id, ready_task_id=ready_task_id).exists()
+
+    @classmethod
+    def grant(cls, user_id, purchase: PurchasedReadyTask, access_kind='purchase'):
+        # create, а не get_or_create: повторная покупка упирается в уникальный индекс и откатывает транзакцию
+        return cls.objects.create(user_id=user_id, ready_task_id=purchase.ready_task_id,
+                                  purchase=purchase, access_kind=access_kind)
+
+    @classmethod
+    def keep_as_gift(cls, user_id, purchase: PurchasedReadyTask):
+        cls.objects.update_or_create(
+            user_id=user_id,
+            ready_task_id=purchase.ready_task_id,
+            defaults={"purchase": purchase, "access_kind": 'gift'},
+        )
+
+    @classmethod
+    def revoke(cls, user_id, ready_task_id):
+        cls.objects.filter(user_id=user_id, ready_task_id=ready_task_id).delete()
+
+
 class SlotPackage(models.Model):
     slots_count = models.PositiveIntegerField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
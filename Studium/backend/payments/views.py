@@ -11,7 +11,7 @@ from rest_framework.response import Response
 from rest_framework.parsers import JSONParser
 from rest_framework import status
 
-from django.db import transaction
+from django.db import transaction, IntegrityError
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.utils import timezone
@@ -27,7 +27,7 @@ from .serializers import (
     FrozenFundsCreateSerializer, PurchasedReadyTaskCreateSerializer,
     SlotsPurchaseCreateSerializer, SlotPackageSerializer
 )
-from .models import SlotPackage, Transaction, Wallet, PurchasedReadyTask, Bank
+from .models import SlotPackage, Transaction, Wallet, ReadyTaskAccess, Bank
 
 from django.db import transaction as db_transaction
 
@@ -350,6 +350,12 @@ class PurchaseReadyTask(APIView):
             )
             print(f"📦 Покупка {purchase.id} создана, работа {ready_task.id}")
 
+            try:
+                ReadyTaskAccess.grant(user_id=user.id, purchase=purchase)
+            except IntegrityError:
+                # Параллельная покупка той же работы: исключение откатывает списание вместе с транзакцией
+                raise AppException(message='Эта работа уже куплена', status_code=status.HTTP_400_BAD_REQUEST)
+
             client_data = {
                 "email": request.user.email,
             }
@@ -401,13 +407,7 @@ class PurchaseReadyTask(APIView):
     @staticmethod
     def _check_already_purchased(user, ready_task: ReadyTask):
         print(f"🔍 Проверка: покупал ли пользователь {user.id} работу {ready_task.id}")
-        exists = PurchasedReadyTask.objects.filter(
-            buyer_transaction__wallet__user=user,
-            ready_task=ready_task,
-            status="paid"
-        ).exists()
-
-        if exists:
+        if ReadyTaskAccess.has_access(user.id, ready_task.id):
             raise AppException(message='Эта работа уже куплена', status_code=status.HTTP_400_BAD_REQUEST)
 
     @staticmethod
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:17
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+
+# Веса на момент миграции: изменения SEARCH_WEIGHTS в приложении не меняют уже применённое заполнение
+SEARCH_CONFIG = 'russian'
+SEARCH_WEIGHTS = {
+    'name': 'A',
+    'discipline': 'B',
+    'type': 'B',
+    'tutor': 'C',
+    'university': 'C',
+    'faculty': 'C',
+    'direction': 'C',
+    'city': 'C',
+    'level': 'C',
+    'description': 'D',
+}
+
+
+def fill_search_vector(apps, schema_editor):
+    model = apps.get_model('ready_tasks', 'ReadyTask')
+    vector = None
+    for field, weight in SEARCH_WEIGHTS.items():
+        part = django.contrib.postgres.search.SearchVector(
+            Coalesce(field, Value('')), weight=weight, config=SEARCH_CONFIG,
+        )
+        vector = part if vector is None else vector + part
+    model.objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ready_tasks', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='readytask',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='ready_task_search_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='ready_task_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(fill_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ready_tasks', '0002_readytask_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='readytask',
+            index=models.Index(fields=['views', 'id'], name='ready_task_views_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=models.Index(fields=['price', 'id'], name='ready_task_price_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=models.Index(fields=['score', 'id'], name='ready_task_score_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=models.Index(fields=['name', 'id'], name='ready_task_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readytask',
+            index=models.Index(fields=['create_date', 'id'], name='ready_task_create_date_id_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:31
+
+from django.db import migrations, models
+
+# Фасеты на момент миграции, заполнение не зависит от последующих изменений studium_backend.facets
+FACET_FIELDS = ('type', 'discipline', 'university', 'level')
+
+
+def fill_facet_counts(apps, schema_editor):
+    model = apps.get_model('ready_tasks', 'ReadyTask')
+    summary_model = apps.get_model('ready_tasks', 'ReadyTaskFacetCount')
+
+    quote = schema_editor.quote_name
+    columns = {field: quote(field) for field in FACET_FIELDS}
+    facet_case = ' '.join(f"WHEN GROUPING({column}) = 0 THEN '{field}'" for field, column in columns.items())
+    value_case = ' '.join(f"WHEN GROUPING({column}) = 0 THEN {column}" for column in columns.values())
+    grouping_sets = ', '.join(f"({column})" for column in columns.values())
+
+    schema_editor.execute(
+        f"INSERT INTO {quote(summary_model._meta.db_table)} (facet, value, count) "
+        f"SELECT facet, value, count FROM ("
+        f"SELECT CASE {facet_case} END AS facet, CASE {value_case} END AS value, COUNT(*) AS count "
+        f"FROM {quote(model._meta.db_table)} WHERE status = %s GROUP BY GROUPING SETS ({grouping_sets})"
+        f") AS counts WHERE value <> ''",
+        ['active'],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ready_tasks', '0003_readytask_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadyTaskFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(choices=[('type', 'Тип работы'), ('discipline', 'Дисциплина'), ('university', 'Университет'), ('level', 'Уровень подготовки')], max_length=20)),
+                ('value', models.CharField(max_length=200)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='readytaskfacetcount',
+            constraint=models.UniqueConstraint(fields=('facet', 'value'), name='ready_task_facet_count_unique'),
+        ),
+        migrations.RunPython(fill_facet_counts, migrations.RunPython.noop),
+    ]
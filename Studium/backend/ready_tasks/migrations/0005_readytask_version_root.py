@@ -0,0 +1,32 @@
+# Generated by Django 4.2.18 on 2026-10-18 07:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Корень каждой существующей цепочки находится одним рекурсивным запросом по previous_version.
+# Если промежуточная версия была удалена, оставшаяся часть цепочки получает свой корень
+FILL_VERSION_ROOT_SQL = """
+WITH RECURSIVE chain AS (
+    SELECT id, id AS root_id FROM ready_tasks_readytask WHERE previous_version_id IS NULL
+    UNION ALL
+    SELECT t.id, chain.root_id FROM ready_tasks_readytask AS t JOIN chain ON t.previous_version_id = chain.id
+)
+UPDATE ready_tasks_readytask AS t SET version_root_id = chain.root_id
+FROM chain WHERE t.id = chain.id AND chain.root_id <> t.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ready_tasks', '0004_readytask_facet_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readytask',
+            name='version_root',
+            field=models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='ready_tasks.readytask'),
+        ),
+        migrations.RunSQL(FILL_VERSION_ROOT_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,5 +1,11 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce
 from authentication.models import CustomUser
+from studium_backend.facets import FACET_CHOICES
+from studium_backend.view_counter import view_counter
 
 
 class ReadyTask(models.Model):
@@ -34,26 +40,86 @@ class ReadyTask(models.Model):
         'self', on_delete=models.SET_NULL, blank=True, null=True, related_name='new_versions'
     )
 
+    # Первая работа цепочки версий, у неё самой пусто. Не меняется после создания и не обнуляется
+    # при удалении первой версии, поэтому цепочка не рвётся
+    version_root = models.ForeignKey(
+        'self', on_delete=models.DO_NOTHING, db_constraint=False, blank=True, null=True, related_name='+',
+        editable=False
+    )
+
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='review')
 
     views = models.PositiveIntegerField(default=0)
 
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='ready_task_search_idx'),
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='ready_task_name_trgm_idx'),
+            # Ключи keyset-пагинации: поле сортировки каталога и id
+            models.Index(fields=['views', 'id'], name='ready_task_views_id_idx'),
+            models.Index(fields=['price', 'id'], name='ready_task_price_id_idx'),
+            models.Index(fields=['score', 'id'], name='ready_task_score_id_idx'),
+            models.Index(fields=['name', 'id'], name='ready_task_name_id_idx'),
+            models.Index(fields=['create_date', 'id'], name='ready_task_create_date_id_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.pk is None and self.previous_version_id and self.version_root_id is None:
+            previous_root_id = (
+                ReadyTask.objects.filter(pk=self.previous_version_id).values_list('version_root_id', flat=True).first()
+            )
+            self.version_root_id = previous_root_id or self.previous_version_id
+
+        # pre_save читает фасеты строки, post_save переносит разницу в сводную таблицу - в одной транзакции
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    @property
+    def chain_id(self):
+        return self.version_root_id or self.id
+
     def get_latest_version(self):
-        latest = self
-        while latest.new_versions.exists():
-            latest = latest.new_versions.last()
-        return latest
+        """Последняя созданная версия из цепочки работы, одним запросом."""
+        return ReadyTask.objects.filter(Q(pk=self.chain_id) | Q(version_root_id=self.chain_id)).order_by('-id').first()
+
+    @classmethod
+    def get_latest_versions(cls, tasks):
+        """Последние версии для нескольких работ одним запросом: {id работы: последняя версия}."""
+        chain_ids = {task.chain_id for task in tasks}
+        if not chain_ids:
+            return {}
+
+        latest = (
+            cls.objects
+            .filter(Q(pk__in=chain_ids) | Q(version_root_id__in=chain_ids))
+            .annotate(chain=Coalesce('version_root_id', 'id'))
+            .order_by('chain', '-id')
+            .distinct('chain')
+        )
+        latest_by_chain = {task.chain: task for task in latest}
+
+        return {task.id: latest_by_chain.get(task.chain_id, task) for task in tasks}
 
     def increment_views(self):
-        from django.db.models import F
-        from django.db import transaction
-        
-        with transaction.atomic():
-            ReadyTask.objects.filter(pk=self.pk).update(views=F('views') + 1)
-            self.refresh_from_db(fields=["views"])
+        # В БД просмотры попадают пачкой из Celery, здесь значение с учётом ещё не перенесённых
+        self.views = view_counter.increment(self)
         return self.views
 
 
+class ReadyTaskFacetCount(models.Model):
+    """Сводная таблица фасетов каталога: количество активных работ по значению фильтра."""
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=200)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['facet', 'value'], name='ready_task_facet_count_unique'),
+        ]
+
+
 class Files(models.Model):
     task = models.ForeignKey(ReadyTask, on_delete=models.CASCADE, related_name='files', blank=True)
     name = models.TextField()
@@ -1,10 +1,17 @@
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from ready_tasks.models import ReadyTask
+from ready_tasks.models import ReadyTask, ReadyTaskFacetCount
+from studium_backend.count_service import CountService
+from studium_backend.facets import remember_facet_values, update_facet_summary
+from studium_backend.response_cache import bump_catalog_version
+from studium_backend.search import is_search_update, update_search_vector
 from .tasks import move_file_between_folders
 
 
+count_service = CountService()
+
+
 @receiver(pre_save, sender=ReadyTask)
 def signal_task_move_file(sender, instance, **kwargs):
     print(f"[INFO] Signal triggered for task {instance.id}")
@@ -15,6 +22,7 @@ def signal_task_move_file(sender, instance, **kwargs):
         
         if old_instance.status != instance.status:
             print(f"[INFO] Status change detected for task {instance.id}: {old_instance.status} -> {instance.status}")
+            bump_catalog_version(ReadyTask)
             
             if instance.status == 'active':
                 print(f"[INFO] Task {instance.id} status changed to active, checking for files")
@@ -35,3 +43,42 @@ def signal_task_move_file(sender, instance, **kwargs):
         print(f"[ERROR] Old instance not found for task {instance.id}")
     except Exception as e:
         print(f"[ERROR] Error in signal_task_move_file for task {instance.id}: {str(e)}")
+
+
+@receiver(post_save, sender=ReadyTask)
+def signal_task_update_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    if is_search_update(created, update_fields):
+        update_search_vector(ReadyTask, instance.pk)
+
+
+@receiver(post_save, sender=ReadyTask)
+@receiver(post_delete, sender=ReadyTask)
+def signal_task_invalidate_counts(sender, instance, update_fields=None, **kwargs):
+    # Просмотры не влияют на состав выборок каталога
+    if update_fields and set(update_fields) <= {"views"}:
+        return
+
+    count_service.invalidate(ReadyTask)
+
+
+@receiver(post_delete, sender=ReadyTask)
+def signal_task_bump_catalog_version(sender, instance, **kwargs):
+    bump_catalog_version(ReadyTask)
+
+
+@receiver(pre_save, sender=ReadyTask)
+def signal_task_remember_facets(sender, instance, update_fields=None, **kwargs):
+    remember_facet_values(instance, update_fields)
+
+
+@receiver(post_save, sender=ReadyTask)
+def signal_task_update_facets(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"views"}:
+        return
+
+    update_facet_summary(ReadyTaskFacetCount, instance)
+
+
+@receiver(post_delete, sender=ReadyTask)
+def signal_task_update_facets_on_delete(sender, instance, **kwargs):
+    update_facet_summary(ReadyTaskFacetCount, instance, deleted=True)
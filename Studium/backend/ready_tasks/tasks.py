@@ -5,9 +5,11 @@ from celery import shared_task
 
 from authentication.models import CustomUser
 from notifications.decorators import notify_on_task_failure
-from .models import ReadyTask, Files
+from .models import ReadyTask, ReadyTaskFacetCount, Files
 from .serializers import ReadyTaskSerializer, FilesSerializer
 from storage.utils import file_mover
+from studium_backend.facets import rebuild_facet_summary
+from studium_backend.view_counter import view_counter
 
 from storage.validate_upload_file_mixin import ValidateUploadFileMixin
 
@@ -143,6 +145,21 @@ def create_ready_task_with_files(task_data: dict):
         raise
 
 
+@shared_task
+def flush_ready_task_views():
+    flushed = view_counter.flush(ReadyTask)
+    if flushed:
+        logger.info(f"Перенесены просмотры {flushed} работ")
+    return flushed
+
+
+@shared_task
+def rebuild_ready_task_facets():
+    rebuilt = rebuild_facet_summary(ReadyTask, ReadyTaskFacetCount)
+    logger.info(f"Пересчитаны фасеты каталога работ: {rebuilt} значений")
+    return rebuilt
+
+
 @shared_task
 def move_file_between_folders(task_id):
     try:
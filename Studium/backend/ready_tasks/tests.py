@@ -1,6 +1,17 @@
-from django.test import TestCase
+import base64
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 from authentication.models import CustomUser
-from .models import ReadyTask
+from payments.models import ReadyTaskAccess
+from studium_backend.facets import get_summary_counts, rebuild_facet_summary
+from .models import ReadyTask, ReadyTaskFacetCount, Files
+
+# Анонимные запросы списка проходят через кеш ответов: без подмены ответы переживали бы тест в Redis
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
 
 
 class ReadyTaskModelTests(TestCase):
@@ -38,3 +49,317 @@ class ReadyTaskModelTests(TestCase):
             previous_version=base,
         )
         self.assertEqual(base.get_latest_version(), child)
+
+    def test_get_latest_versions_resolves_chains_in_one_query(self):
+        data = dict(owner=self.user, discipline="Math", type="essay", description="Desc", city="c", university="u",
+                    faculty="f", direction="d", level="l", tutor="t", price=10)
+        base = ReadyTask.objects.create(name="v1", **data)
+        second = ReadyTask.objects.create(name="v2", previous_version=base, **data)
+        third = ReadyTask.objects.create(name="v3", previous_version=second, **data)
+        single = ReadyTask.objects.create(name="single", **data)
+
+        self.assertEqual(third.version_root_id, base.id)
+
+        with self.assertNumQueries(1):
+            latest = ReadyTask.get_latest_versions([base, second, single])
+
+        self.assertEqual(latest, {base.id: third, second.id: third, single.id: single})
+
+
+@override_settings(CACHES=NO_CACHE)
+class ReadyTaskSearchTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="search@example.com", password="pass")
+
+    def _create_task(self, name, status="active"):
+        return ReadyTask.objects.create(
+            owner=self.user,
+            name=name,
+            discipline="Math",
+            type="essay",
+            description="Desc",
+            city="c",
+            university="u",
+            faculty="f",
+            direction="d",
+            level="l",
+            tutor="t",
+            price=10,
+            status=status,
+        )
+
+    def test_search_query_ranks_matching_tasks(self):
+        match = self._create_task("Курсовая по линейной алгебре")
+        self._create_task("Реферат по истории")
+
+        response = self.client.get("/api/rt/all/", {"q": "алгебра"}, secure=True)
+
+        ids = [item["id"] for item in response.json()["page_data"]]
+        self.assertEqual(ids, [match.id])
+
+
+@override_settings(CACHES=NO_CACHE)
+class ReadyTaskCursorPaginationTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="cursor@example.com", password="pass")
+        self.tasks = [
+            ReadyTask.objects.create(
+                owner=self.user,
+                name=f"Task {index}",
+                discipline="Math",
+                type="essay",
+                description="Desc",
+                city="c",
+                university="u",
+                faculty="f",
+                direction="d",
+                level="l",
+                tutor="t",
+                price=10,
+                status="active",
+                views=index % 2,
+            )
+            for index in range(5)
+        ]
+
+    def test_cursor_pages_cover_all_tasks_once(self):
+        params = {"pagination": "cursor", "page_size": 2}
+        seen = []
+
+        while True:
+            data = self.client.get("/api/rt/all/", params, secure=True).json()
+            seen.extend(item["id"] for item in data["page_data"])
+            self.assertIsNone(data["total_count"])
+            if not data["has_next"]:
+                break
+            params["cursor"] = data["next"]
+
+        expected = sorted(self.tasks, key=lambda task: (task.views, task.id), reverse=True)
+        self.assertEqual(seen, [task.id for task in expected])
+
+        previous = self.client.get("/api/rt/all/", {"cursor": data["prev"], "page_size": 2}, secure=True).json()
+        self.assertEqual([item["id"] for item in previous["page_data"]], seen[-3:-1])
+
+    def test_forged_cursor_values_return_bad_request(self):
+        forged_values = [["abc", 1], [1, "abc"], [None, 1], [{"views": 1}, 1], [1]]
+
+        for values in forged_values:
+            cursor = base64.urlsafe_b64encode(json.dumps(["n", values]).encode()).decode().rstrip("=")
+            response = self.client.get("/api/rt/all/", {"cursor": cursor, "page_size": 2}, secure=True)
+            self.assertEqual(response.status_code, 400, values)
+
+
+@override_settings(CACHES=NO_CACHE)
+class ReadyTaskEstimatedCountPaginationTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="estimate@example.com", password="pass")
+        for index in range(5):
+            ReadyTask.objects.create(
+                owner=self.user,
+                name=f"Task {index}",
+                discipline="Math",
+                type="essay",
+                description="Desc",
+                city="c",
+                university="u",
+                faculty="f",
+                direction="d",
+                level="l",
+                tutor="t",
+                price=10,
+                status="active",
+            )
+
+    def get_page(self, page, estimate):
+        with patch("ready_tasks.views.ReadyTaskListAPIView.count_service") as count_service:
+            count_service.get_count.return_value = (estimate, True)
+            return self.client.get("/api/rt/all/", {"page": page, "page_size": 2}, secure=True)
+
+    def test_low_estimate_does_not_hide_pages(self):
+        response = self.get_page(3, estimate=1)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["page_data"]), 1)
+        self.assertEqual(data["total_count"], 1)
+        self.assertTrue(data["total_count_is_estimate"])
+        self.assertFalse(data["has_next"])
+        self.assertTrue(data["has_previous"])
+
+    def test_high_estimate_does_not_report_next_page(self):
+        data = self.get_page(2, estimate=1000).json()
+        self.assertEqual(len(data["page_data"]), 2)
+        self.assertTrue(data["has_next"])
+
+        data = self.get_page(4, estimate=1000).json()
+        self.assertEqual(data["page_data"], [])
+        self.assertFalse(data["has_next"])
+
+    def test_page_below_one_is_bad_request(self):
+        self.assertEqual(self.get_page(0, estimate=5).status_code, 400)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class ReadyTaskListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email="cache@example.com", password="pass")
+        ReadyTask.objects.create(
+            owner=self.user,
+            name="Cached task",
+            discipline="Math",
+            type="essay",
+            description="Desc",
+            city="c",
+            university="u",
+            faculty="f",
+            direction="d",
+            level="l",
+            tutor="t",
+            price=10,
+            status="active",
+        )
+
+    def test_anonymous_list_is_cached_and_revalidated(self):
+        first = self.client.get("/api/rt/all/", {"page": 1}, secure=True)
+        second = self.client.get("/api/rt/all/", {"page": 1}, secure=True)
+        revalidated = self.client.get("/api/rt/all/", {"page": 1}, secure=True, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_metrics_error_does_not_break_cached_response(self):
+        first = self.client.get("/api/rt/all/", {"page": 1}, secure=True)
+
+        with patch("studium_backend.response_cache.cache.incr", side_effect=ConnectionError("redis down")):
+            second = self.client.get("/api/rt/all/", {"page": 1}, secure=True)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+
+
+@override_settings(CACHES=NO_CACHE)
+class ReadyTaskFacetsTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="facets@example.com", password="pass")
+
+    def _create_task(self, type, university, status="active"):
+        return ReadyTask.objects.create(
+            owner=self.user,
+            name="Task",
+            discipline="Math",
+            type=type,
+            description="Desc",
+            city="c",
+            university=university,
+            faculty="f",
+            direction="d",
+            level="l",
+            tutor="t",
+            price=10,
+            status=status,
+        )
+
+    def test_summary_follows_status_changes(self):
+        self._create_task("essay", "u1")
+        task = self._create_task("essay", "u2")
+        self._create_task("report", "u1", status="review")
+
+        self.assertEqual(ReadyTaskFacetCount.objects.get(facet="type", value="essay").count, 2)
+        self.assertFalse(ReadyTaskFacetCount.objects.filter(value="report").exists())
+
+        task.status = "unpublished"
+        task.save()
+
+        response = self.client.get("/api/rt/facets/", secure=True)
+
+        self.assertEqual(response.json()["type"], [{"value": "essay", "count": 1}])
+        self.assertEqual(response.json()["university"], [{"value": "u1", "count": 1}])
+
+    def test_filtered_facets_use_current_filters(self):
+        self._create_task("essay", "u1")
+        self._create_task("report", "u1")
+        self._create_task("essay", "u2")
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/rt/facets/", {"university": "u2"}, secure=True)
+
+        self.assertEqual(response.json()["type"], [{"value": "essay", "count": 1}])
+        self.assertEqual(response.json()["discipline"], [{"value": "Math", "count": 1}])
+
+    def test_rebuild_replaces_drifted_counts(self):
+        self._create_task("essay", "u1")
+        self._create_task("report", "u1")
+        ReadyTaskFacetCount.objects.filter(facet="type", value="essay").update(count=-1)
+        ReadyTaskFacetCount.objects.create(facet="level", value="stale", count=3)
+
+        with self.assertLogs("studium_backend.facets", level="WARNING"):
+            rebuilt = rebuild_facet_summary(ReadyTask, ReadyTaskFacetCount)
+
+        counts = get_summary_counts(ReadyTaskFacetCount)
+        self.assertEqual(rebuilt, len(counts))
+        self.assertEqual(counts[("type", "essay")], 1)
+        self.assertEqual(counts[("university", "u1")], 2)
+        self.assertNotIn(("level", "stale"), counts)
+
+
+@patch("ready_tasks.views.S3Client")
+@patch("ready_tasks.models.view_counter.increment", side_effect=lambda task: task.views + 1)
+class ReadyTaskDetailQueryTests(TestCase):
+    MAX_QUERIES = 2
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email="detail@example.com", password="pass")
+        self.task = ReadyTask.objects.create(
+            owner=self.user,
+            name="Detail task",
+            discipline="Math",
+            type="essay",
+            description="Desc",
+            city="c",
+            university="u",
+            faculty="f",
+            direction="d",
+            level="l",
+            tutor="t",
+            price=10,
+            status="active",
+        )
+        for index in range(3):
+            Files.objects.create(task=self.task, name=f"file{index}.pdf", size="10", path=f"p/{index}",
+                                 is_public=index == 0)
+
+    def test_anonymous_detail_query_count(self, increment, s3_client):
+        s3_client.return_value.generate_temp_url.return_value = ["https://example.com/file"]
+
+        with self.assertNumQueries(self.MAX_QUERIES):
+            response = self.client.get(f"/api/rt/{self.task.id}/", secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["is_purchased"])
+        self.assertEqual(len(response.json()["files"]), 3)
+
+    def test_owner_detail_query_count(self, increment, s3_client):
+        s3_client.return_value.generate_temp_url.return_value = ["https://example.com/file"]
+        self.client.force_authenticate(self.user)
+
+        with self.assertNumQueries(self.MAX_QUERIES):
+            response = self.client.get(f"/api/rt/{self.task.id}/", secure=True)
+
+        self.assertTrue(response.json()["is_owner"])
+
+    def test_buyer_detail_is_purchased(self, increment, s3_client):
+        s3_client.return_value.generate_temp_url.return_value = ["https://example.com/file"]
+        buyer = CustomUser.objects.create_user(email="buyer@example.com", password="pass")
+        ReadyTaskAccess.objects.create(user=buyer, ready_task=self.task)
+        self.client.force_authenticate(buyer)
+
+        with self.assertNumQueries(self.MAX_QUERIES):
+            response = self.client.get(f"/api/rt/{self.task.id}/", secure=True)
+
+        self.assertTrue(response.json()["is_purchased"])
+        self.assertFalse(response.json()["is_owner"])
@@ -1,20 +1,26 @@
 import json
 
 from rest_framework.exceptions import ValidationError
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import generics, status
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from studium_backend.count_service import CountService, CountedPaginator
 from studium_backend.decorators import catch_and_log_exceptions
 from studium_backend.exceptions import AppException
+from studium_backend.facets import format_facets, get_facet_counts, get_summary_counts, has_catalog_filters
+from studium_backend.pagination import is_cursor_request, paginate_by_cursor
+from studium_backend.response_cache import cache_anonymous_response, get_cache_metrics
+from studium_backend.search import apply_search, get_search_text
 
 from .serializers import *
 from .tasks import create_ready_task_with_files
-from payments.models import PurchasedReadyTask
+from payments.models import ReadyTaskAccess
+from order_tasks.models import OrderTask
 
 from django.core.paginator import Paginator, EmptyPage
-from django.db.models import Q
+from django.db.models import BooleanField, Exists, OuterRef, Value
 from storage.object_storage import S3Client
 from studium_backend.settings import AWS_PRIVATE_STORAGE_BUCKET_NAME, AWS_PRIVATE_ENDPOINT_URL, \
     AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
@@ -180,6 +186,7 @@ class ReadyTaskCreateAPIView(generics.CreateAPIView):
 class ReadyTaskListAPIView(generics.ListAPIView):
     serializer_class = ShortInfoReadyTaskSerializer
     permission_classes = (AllowAny,)
+    count_service = CountService()
 
     SORT_MAP = {
         "По популярности": "-views",
@@ -215,23 +222,32 @@ class ReadyTaskListAPIView(generics.ListAPIView):
                     if value:
                         queryset = queryset.filter(**{f"{field}__{lookup_type}": value})
 
+        queryset = apply_search(queryset, get_search_text(search_data), order_by_rank=sort_value not in self.SORT_MAP)
+
         return queryset
 
+    @cache_anonymous_response(ReadyTask)
     @catch_and_log_exceptions
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        total_count = queryset.count()
+
+        if is_cursor_request(request.query_params):
+            rows, page_info = paginate_by_cursor(queryset, request.query_params, self.count_service)
+            serializer = self.get_serializer(rows, many=True)
+            return Response({"page_data": serializer.data, **page_info})
 
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", 10))
 
-        paginator = Paginator(queryset, page_size)
+        total_count, is_estimate = self.count_service.get_count(queryset)
+        paginator = CountedPaginator(queryset, page_size, total_count)
         paginated_queryset = paginator.page(page)
 
         serializer = self.get_serializer(paginated_queryset, many=True)
 
         return Response({
             "total_count": total_count,
+            "total_count_is_estimate": is_estimate,
             "page_data": serializer.data,
             "has_next": paginated_queryset.has_next(),
             "has_previous": paginated_queryset.has_previous(),
@@ -241,6 +257,7 @@ class ReadyTaskListAPIView(generics.ListAPIView):
 class ReadyTaskSoldListAPIView(generics.ListAPIView):
     serializer_class = ShortInfoReadyTaskSerializer
     permission_classes = (AllowAny,)
+    count_service = CountService()
 
     SORT_MAP = {
         "По популярности": "-views",
@@ -285,23 +302,31 @@ class ReadyTaskSoldListAPIView(generics.ListAPIView):
                     if value:
                         queryset = queryset.filter(**{f"{field}__{lookup_type}": value})
 
+        queryset = apply_search(queryset, get_search_text(search_data), order_by_rank=sort_value not in self.SORT_MAP)
+
         return queryset
 
     @catch_and_log_exceptions
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        total_count = queryset.count()
+
+        if is_cursor_request(request.query_params):
+            rows, page_info = paginate_by_cursor(queryset, request.query_params, self.count_service)
+            serializer = self.get_serializer(rows, many=True)
+            return Response({"page_data": serializer.data, **page_info})
 
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", 10))
 
-        paginator = Paginator(queryset, page_size)
+        total_count, is_estimate = self.count_service.get_count(queryset)
+        paginator = CountedPaginator(queryset, page_size, total_count)
         paginated_queryset = paginator.page(page)
 
         serializer = self.get_serializer(paginated_queryset, many=True)
 
         return Response({
             "total_count": total_count,
+            "total_count_is_estimate": is_estimate,
             "page_data": serializer.data,
             "has_next": paginated_queryset.has_next(),
             "has_previous": paginated_queryset.has_previous(),
@@ -335,13 +360,10 @@ class ReadyTaskBoughtListAPIView(generics.GenericAPIView):
         search_data = self.request.query_params
 
         queryset = (
-            PurchasedReadyTask.objects
-            .filter(
-                Q(buyer_transaction__wallet__user__id=user.id, status="paid") |
-                Q(buyer_transaction__wallet__user__id=user.id, status="refunded", is_gift=True)
-            )
+            ReadyTaskAccess.objects
+            .filter(user_id=user.id)
             .select_related("ready_task")
-            .order_by("-created_at")
+            .order_by("-created_at", "-id")
         )
 
         for lookup_type, fields in self.SEARCH_FIELDS.items():
@@ -381,11 +403,35 @@ class ReadyTaskBoughtListAPIView(generics.GenericAPIView):
         })
 
 
+
+class ReadyTaskFacetsAPIView(ReadyTaskListAPIView):
+    """Количество работ по типу, дисциплине, университету и уровню для текущих фильтров каталога."""
+
+    @catch_and_log_exceptions
+    def get(self, request, *args, **kwargs):
+        if has_catalog_filters(request.query_params, self.SEARCH_FIELDS):
+            counts = get_facet_counts(self.get_queryset())
+        else:
+            counts = get_summary_counts(ReadyTaskFacetCount)
+
+        return Response(format_facets(counts), status=status.HTTP_200_OK)
+
+
 class ReadyTaskDetailAPIView(generics.RetrieveAPIView):
-    queryset = ReadyTask.objects.all()
     serializer_class = ReadyTaskSerializer
     permission_classes = (AllowAny,)
 
+    def get_queryset(self):
+        user_id = getattr(self.request.user, 'id', None)
+
+        # Работа, владелец с профилем и статус покупки - одним запросом, файлы - одним prefetch
+        return (
+            ReadyTask.objects
+            .select_related('owner__client')
+            .prefetch_related('files')
+            .annotate(is_purchased=self._get_purchased_expression(user_id))
+        )
+
     @catch_and_log_exceptions
     def get(self, request, *args, **kwargs):
         task = self.get_object()
@@ -401,10 +447,10 @@ class ReadyTaskDetailAPIView(generics.RetrieveAPIView):
     def _prepare_response_data(self, task, user, task_data):
         user_id = getattr(user, 'id', None)
         is_owner = user_id is not None and user_id == task.owner_id
-        purchased = self._check_if_purchased(user_id, task.id)
+        purchased = task.is_purchased
 
         can_view_all_files = is_owner or purchased
-        files = task.files.all()
+        files = list(task.files.all())
 
         owner = task.owner
 
@@ -418,21 +464,17 @@ class ReadyTaskDetailAPIView(generics.RetrieveAPIView):
             "views": task.views,
         }
 
-        if files.exists():
+        if files:
             response_data["files"] = self._get_files_data(files, can_view_all_files)
-            
+
         return response_data
 
     @staticmethod
-    def _check_if_purchased(user_id, task_id):
+    def _get_purchased_expression(user_id):
         if user_id is None:
-            return False
+            return Value(False, output_field=BooleanField())
 
-        return PurchasedReadyTask.objects.filter(
-            Q(buyer_transaction__wallet__user__id=user_id, status='paid', ready_task_id=task_id) |
-            Q(buyer_transaction__wallet__user__id=user_id, status='refunded', is_gift=True,
-              ready_task_id=task_id)
-        ).exists()
+        return Exists(ReadyTaskAccess.objects.filter(user_id=user_id, ready_task_id=OuterRef('pk')))
 
     @staticmethod
     def _filter_task_data(task_data):
@@ -554,3 +596,10 @@ class ReadyTaskHideAPIView(generics.UpdateAPIView):
             status=status.HTTP_200_OK
         )
 
+
+class CatalogCacheMetricsAPIView(generics.GenericAPIView):
+    permission_classes = [IsAdminUser]
+
+    @catch_and_log_exceptions
+    def get(self, request, *args, **kwargs):
+        return Response(get_cache_metrics([ReadyTask, OrderTask]), status=status.HTTP_200_OK)
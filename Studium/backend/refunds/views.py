@@ -8,7 +8,7 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from django.utils import timezone
-from payments.models import PurchasedReadyTask, Transaction, FrozenFunds
+from payments.models import PurchasedReadyTask, ReadyTaskAccess, Transaction, FrozenFunds
 from payments.serializers import TransactionCreateSerializer
 
 from studium_backend.decorators import catch_and_log_exceptions
@@ -239,6 +239,12 @@ class RefundProcessView(APIView):
             "is_gift",
         ])
 
+        buyer_id = purchase.buyer_transaction.wallet.user_id
+        if keep_product:
+            ReadyTaskAccess.keep_as_gift(user_id=buyer_id, purchase=purchase)
+        else:
+            ReadyTaskAccess.revoke(user_id=buyer_id, ready_task_id=purchase.ready_task_id)
+
     @staticmethod
     def _create_refund_receipt(purchase: PurchasedReadyTask, buyer_txn: Transaction):
         if purchase.is_gift:
@@ -16,7 +16,7 @@ from .tasks import generate_temp_url
 from .mixins import FileUploadMixin, ArchiveDownloadMixin, PublicFileDownloadMixin
 
 from ready_tasks.models import ReadyTask
-from payments.models import PurchasedReadyTask
+from payments.models import ReadyTaskAccess
 from reports.models import ReportComment
 
 
@@ -96,9 +96,7 @@ class StartUpdateFileTemporaryLinksView(APIView):
     def _update_ready_task_links(user, work_id):
         task = ReadyTask.objects.get(id=work_id)
 
-        bought_tasks = PurchasedReadyTask.objects.filter(buyer=user.id).values_list("task_id", flat=True)
-
-        if user == task.owner or work_id in bought_tasks:
+        if user == task.owner or ReadyTaskAccess.has_access(user.id, task.id):
             files = task.files.all()
         else:
             files = task.files.filter(is_public=True)
@@ -30,6 +30,22 @@ app.conf.beat_schedule = {
         "task": "payments.tasks.check_withdrawals_status",
         "schedule": crontab(hour=3, minute=0),
     },
+    'flush-ready-task-views-every-minute': {
+        'task': 'ready_tasks.tasks.flush_ready_task_views',
+        'schedule': crontab(),
+    },
+    'flush-order-task-views-every-minute': {
+        'task': 'order_tasks.tasks.flush_order_task_views',
+        'schedule': crontab(),
+    },
+    'rebuild-ready-task-facets-daily': {
+        'task': 'ready_tasks.tasks.rebuild_ready_task_facets',
+        'schedule': crontab(hour=4, minute=0),
+    },
+    'rebuild-order-task-facets-daily': {
+        'task': 'order_tasks.tasks.rebuild_order_task_facets',
+        'schedule': crontab(hour=4, minute=10),
+    },
 
 }
 
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+
+import redis
+from django.conf import settings
+from django.db import connection
+from rest_framework import status
+
+from studium_backend.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+
+class CountService:
+    """
+    Количество строк для списков каталога: точный COUNT кэшируется в Redis по подписи запроса,
+    а для больших выборок берётся оценка планировщика вместо полного подсчёта.
+    """
+    CACHE_KEY = "counts:{label}:{generation}:{signature}"
+    GENERATION_KEY = "counts:{label}:generation"
+    CACHE_TTL = 60
+
+    # Оценка вместо COUNT только для больших таблиц и широких выборок
+    ESTIMATE_MIN_TABLE_ROWS = 100000
+    ESTIMATE_MIN_ROWS = 10000
+
+    CACHED_MODELS = {"ready_tasks.readytask", "order_tasks.ordertask"}
+
+    def __init__(self):
+        self.redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    def get_count(self, queryset):
+        """Возвращает (количество, is_estimate)."""
+        label = queryset.model._meta.label_lower
+
+        if label not in self.CACHED_MODELS:
+            return queryset.count(), False
+
+        queryset = queryset.order_by()
+        sql, params = queryset.query.sql_with_params()
+        signature = hashlib.sha1(f"{sql}|{params!r}".encode()).hexdigest()
+
+        try:
+            generation = self.redis_client.get(self.GENERATION_KEY.format(label=label)) or 0
+            cache_key = self.CACHE_KEY.format(label=label, generation=generation, signature=signature)
+            cached = self.redis_client.get(cache_key)
+        except redis.RedisError as e:
+            logger.warning(f"Кеш количества недоступен: {e}")
+            return queryset.count(), False
+
+        if cached:
+            count, is_estimate = json.loads(cached)
+            return count, is_estimate
+
+        count, is_estimate = self._estimate_count(queryset, sql, params)
+        if count is None:
+            count, is_estimate = queryset.count(), False
+
+        try:
+            self.redis_client.setex(cache_key, self.CACHE_TTL, json.dumps([count, is_estimate]))
+        except redis.RedisError as e:
+            logger.warning(f"Не удалось сохранить количество в кеш: {e}")
+
+        return count, is_estimate
+
+    def invalidate(self, model):
+        try:
+            self.redis_client.incr(self.GENERATION_KEY.format(label=model._meta.label_lower))
+        except redis.RedisError as e:
+            logger.warning(f"Не удалось сбросить кеш количества {model._meta.label_lower}: {e}")
+
+    def _estimate_count(self, queryset, sql, params):
+        # reltuples только решает, большая ли таблица: списки каталога всегда фильтруются по статусу,
+        # поэтому само количество берётся из плана запроса
+        table_rows = self._get_table_estimate(queryset.model._meta.db_table)
+
+        if table_rows < self.ESTIMATE_MIN_TABLE_ROWS:
+            return None, False
+
+        plan_rows = self._get_plan_estimate(sql, params)
+        if plan_rows >= self.ESTIMATE_MIN_ROWS:
+            return plan_rows, True
+
+        return None, False
+
+    @staticmethod
+    def _get_table_estimate(db_table):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [db_table])
+            row = cursor.fetchone()
+
+        # -1 у таблиц, по которым ещё не собиралась статистика
+        return max(row[0], 0) if row else 0
+
+    @staticmethod
+    def _get_plan_estimate(sql, params):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CountedPage(Sequence):
+    def __init__(self, object_list, number, has_next):
+        self.object_list = object_list
+        self.number = number
+        self._has_next = has_next
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+
+class CountedPaginator:
+    """
+    Постраничный вывод с заранее посчитанным количеством, чтобы не выполнять повторный COUNT.
+    Количество может быть оценкой, поэтому оно только отображается: номер страницы по нему не проверяется,
+    а наличие следующей страницы определяется выборкой на одну строку больше размера страницы.
+    """
+
+    def __init__(self, object_list, per_page, count):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.count = count
+
+    def page(self, number):
+        if number < 1 or self.per_page < 1:
+            raise AppException(message="Неверные данные пагинации", status_code=status.HTTP_400_BAD_REQUEST)
+
+        offset = (number - 1) * self.per_page
+        rows = list(self.object_list[offset:offset + self.per_page + 1])
+
+        return CountedPage(rows[:self.per_page], number, len(rows) > self.per_page)
@@ -0,0 +1,150 @@
+import logging
+from collections import Counter
+
+from django.db import connection, transaction
+
+from studium_backend.search import SEARCH_QUERY_PARAM
+
+FACET_FIELDS = ("type", "discipline", "university", "level")
+FACET_CHOICES = [
+    ("type", "Тип работы"),
+    ("discipline", "Дисциплина"),
+    ("university", "Университет"),
+    ("level", "Уровень подготовки"),
+]
+FACET_LIMIT = 50
+ACTIVE_STATUS = "active"
+
+logger = logging.getLogger(__name__)
+
+
+def get_facet_counts(queryset):
+    """
+    Количество записей выборки по каждому значению фасетов одним запросом (GROUPING SETS),
+    возвращает Counter {(фасет, значение): количество}.
+    """
+    inner_sql, params = queryset.order_by().values(*FACET_FIELDS).query.sql_with_params()
+    columns = {field: f"t.{connection.ops.quote_name(field)}" for field in FACET_FIELDS}
+
+    facet_case = " ".join(f"WHEN GROUPING({column}) = 0 THEN '{field}'" for field, column in columns.items())
+    value_case = " ".join(f"WHEN GROUPING({column}) = 0 THEN {column}" for column in columns.values())
+    grouping_sets = ", ".join(f"({column})" for column in columns.values())
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT CASE {facet_case} END, CASE {value_case} END, COUNT(*) "
+            f"FROM ({inner_sql}) AS t GROUP BY GROUPING SETS ({grouping_sets})",
+            params,
+        )
+        rows = cursor.fetchall()
+
+    return Counter({(facet, value): count for facet, value, count in rows if value})
+
+
+def has_catalog_filters(query_params, search_fields):
+    """Есть ли в запросе фильтры списка; без них фасеты берутся из сводной таблицы."""
+    fields = [field for lookup_fields in search_fields.values() for field in lookup_fields]
+    return any(query_params.get(field) for field in fields + [SEARCH_QUERY_PARAM])
+
+
+def get_summary_counts(summary_model):
+    rows = summary_model.objects.filter(count__gt=0).values_list("facet", "value", "count")
+    return Counter({(facet, value): count for facet, value, count in rows})
+
+
+def format_facets(counts, limit=FACET_LIMIT):
+    facets = {field: [] for field in FACET_FIELDS}
+
+    for (facet, value), count in sorted(counts.items(), key=lambda item: (-item[1], item[0][1])):
+        if count > 0 and len(facets[facet]) < limit:
+            facets[facet].append({"value": value, "count": count})
+
+    return facets
+
+
+def _get_instance_counts(instance):
+    if instance.status != ACTIVE_STATUS:
+        return Counter()
+    return Counter({(field, getattr(instance, field)): 1 for field in FACET_FIELDS if getattr(instance, field)})
+
+
+def _apply_delta(summary_model, delta):
+    delta = {key: count for key, count in delta.items() if count}
+    if not delta:
+        return
+
+    table = connection.ops.quote_name(summary_model._meta.db_table)
+    values = ", ".join(["(%s, %s, %s)"] * len(delta))
+    params = [value for (facet, facet_value), count in delta.items() for value in (facet, facet_value, count)]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} AS s (facet, value, count) VALUES {values} "
+            f"ON CONFLICT (facet, value) DO UPDATE SET count = s.count + EXCLUDED.count",
+            params,
+        )
+
+
+def remember_facet_values(instance, update_fields=None):
+    """pre_save: запоминает фасеты записи до изменения, если она была в каталоге."""
+    instance._facet_counts_before = Counter()
+
+    if instance.pk is None or (update_fields and set(update_fields) <= {"views"}):
+        return
+
+    queryset = type(instance).objects.filter(pk=instance.pk).only("status", *FACET_FIELDS)
+
+    # Строка блокируется до post_save: параллельное сохранение той же записи не вычтет её фасеты дважды
+    if connection.in_atomic_block:
+        queryset = queryset.select_for_update()
+
+    old_instance = queryset.first()
+    if old_instance:
+        instance._facet_counts_before = _get_instance_counts(old_instance)
+
+
+def update_facet_summary(summary_model, instance, deleted=False):
+    """post_save/post_delete: переносит в сводную таблицу разницу фасетов записи до и после изменения."""
+    if deleted:
+        before, after = _get_instance_counts(instance), Counter()
+    else:
+        before, after = getattr(instance, "_facet_counts_before", Counter()), _get_instance_counts(instance)
+
+    delta = Counter(after)
+    delta.subtract(before)
+    _apply_delta(summary_model, delta)
+
+
+def subtract_facet_counts(summary_model, queryset):
+    """Вычитает фасеты выборки перед массовым снятием с публикации через update()."""
+    delta = Counter()
+    delta.subtract(get_facet_counts(queryset.filter(status=ACTIVE_STATUS)))
+    _apply_delta(summary_model, delta)
+
+
+def rebuild_facet_summary(model, summary_model):
+    """Полный пересчёт сводной таблицы, исправляет расхождения после массовых изменений мимо сигналов."""
+    table = connection.ops.quote_name(summary_model._meta.db_table)
+
+    with transaction.atomic():
+        # Блокировка ждёт транзакции, уже изменившие сводную таблицу, и держит новые изменения до COMMIT,
+        # поэтому подсчёт под ней согласован со всеми применёнными и будущими разницами сигналов
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+
+        counts = get_facet_counts(model.objects.filter(status=ACTIVE_STATUS))
+
+        # Расхождения, в том числе отрицательные количества, которые скрывает get_summary_counts
+        rows = summary_model.objects.values_list("facet", "value", "count")
+        previous = Counter({(facet, value): count for facet, value, count in rows})
+        drifted = sum(1 for key in set(previous) | set(counts) if previous[key] != counts[key])
+        if drifted:
+            logger.warning(f"Сводная таблица {summary_model._meta.label} расходилась с данными: {drifted} значений")
+
+        summary_model.objects.all().delete()
+        summary_model.objects.bulk_create(
+            [summary_model(facet=facet, value=value, count=count) for (facet, value), count in counts.items()],
+            batch_size=1000,
+        )
+
+    return len(counts)
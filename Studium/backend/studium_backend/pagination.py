@@ -0,0 +1,170 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import status
+
+from studium_backend.exceptions import AppException
+
+PAGINATION_PARAM = "pagination"
+CURSOR_MODE = "cursor"
+CURSOR_PARAM = "cursor"
+COUNT_PARAM = "with_count"
+PAGE_SIZE_PARAM = "page_size"
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+DIRECTION_NEXT = "n"
+DIRECTION_PREV = "p"
+
+
+class InvalidCursorException(AppException):
+    default_status_code = status.HTTP_400_BAD_REQUEST
+    default_message = "Неверный курсор страницы"
+
+
+def is_cursor_request(query_params):
+    return query_params.get(PAGINATION_PARAM) == CURSOR_MODE or bool(query_params.get(CURSOR_PARAM))
+
+
+def _get_page_size(query_params):
+    try:
+        page_size = int(query_params.get(PAGE_SIZE_PARAM, DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise AppException(message="Неверные данные пагинации", status_code=status.HTTP_400_BAD_REQUEST)
+
+    if page_size <= 0:
+        raise AppException(message="Неверные данные пагинации", status_code=status.HTTP_400_BAD_REQUEST)
+
+    return min(page_size, MAX_PAGE_SIZE)
+
+
+def _get_ordering(queryset):
+    """Сортировка запроса с id в конце, чтобы ключ страницы был уникальным."""
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering or [])
+
+    if any(not isinstance(field, str) for field in ordering):
+        raise ValueError("Keyset pagination supports only field-name ordering")
+
+    ordering = ["-id" if field == "-pk" else "id" if field == "pk" else field for field in ordering]
+    names = [field.lstrip("-") for field in ordering]
+
+    if "id" in names:
+        return ordering[:names.index("id") + 1]
+
+    descending = ordering[0].startswith("-") if ordering else True
+    return ordering + ["-id" if descending else "id"]
+
+
+def _get_ordering_fields(queryset, ordering):
+    """Поля модели или аннотации для каждого ключа сортировки, по ним проверяются значения курсора."""
+    fields = []
+
+    for field in ordering:
+        name = field.lstrip("-")
+
+        if name in queryset.query.annotations:
+            fields.append(queryset.query.annotations[name].output_field)
+            continue
+
+        opts = queryset.model._meta
+        *relations, field_name = name.split(LOOKUP_SEP)
+        for relation in relations:
+            opts = opts.get_field(relation).related_model._meta
+        fields.append(opts.get_field(field_name))
+
+    return fields
+
+
+def _invert(field):
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def _keyset_filter(ordering, values, reverse):
+    # (a, b) после (x, y): a > x ИЛИ (a = x И b > y), с учётом направления каждого поля
+    condition = Q()
+    equal = {}
+
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-") != reverse
+        condition |= Q(**equal, **{f"{name}__{'lt' if descending else 'gt'}": value})
+        equal[name] = value
+
+    return condition
+
+
+def _encode_cursor(direction, row, ordering):
+    values = [getattr(row, field.lstrip("-")) for field in ordering]
+    data = json.dumps([direction, values], default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _decode_cursor(cursor, fields):
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, values = json.loads(data)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorException()
+
+    if direction not in (DIRECTION_NEXT, DIRECTION_PREV) or not isinstance(values, list) \
+            or len(values) != len(fields):
+        raise InvalidCursorException()
+
+    # Значения из курсора приводятся к типам полей сортировки: поддельный курсор даёт 400, а не ошибку ORM
+    try:
+        values = [field.clean(value, None) for field, value in zip(fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        raise InvalidCursorException()
+
+    if any(value is None for value in values):
+        raise InvalidCursorException()
+
+    return direction, values
+
+
+def paginate_by_cursor(queryset, query_params, count_service=None):
+    """
+    Keyset-пагинация: страница выбирается условием по значениям сортировки последней строки,
+    поэтому глубокие страницы не требуют OFFSET. Точное количество считается только по with_count=true.
+    """
+    page_size = _get_page_size(query_params)
+    ordering = _get_ordering(queryset)
+    cursor = query_params.get(CURSOR_PARAM)
+
+    direction, values = _decode_cursor(cursor, _get_ordering_fields(queryset, ordering)) \
+        if cursor else (DIRECTION_NEXT, None)
+    reverse = direction == DIRECTION_PREV
+
+    page_queryset = queryset.order_by(*([_invert(field) for field in ordering] if reverse else ordering))
+    if values is not None:
+        page_queryset = page_queryset.filter(_keyset_filter(ordering, values, reverse))
+
+    rows = list(page_queryset[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if reverse:
+        rows.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, values is not None
+
+    total_count, is_estimate = None, False
+    if query_params.get(COUNT_PARAM) == "true":
+        total_count, is_estimate = count_service.get_count(queryset) if count_service else (queryset.count(), False)
+
+    page_info = {
+        "total_count": total_count,
+        "total_count_is_estimate": is_estimate,
+        "has_next": has_next and bool(rows),
+        "has_previous": has_previous and bool(rows),
+        "next": _encode_cursor(DIRECTION_NEXT, rows[-1], ordering) if has_next and rows else None,
+        "prev": _encode_cursor(DIRECTION_PREV, rows[0], ordering) if has_previous and rows else None,
+    }
+
+    return rows, page_info
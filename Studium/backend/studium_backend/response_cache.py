@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_TTL = 300
+VERSION_KEY = "catalog:{label}:version"
+RESPONSE_KEY = "catalog:{label}:{version}:{signature}"
+METRICS_KEY = "catalog:metrics:{label}:{result}"
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_NOT_MODIFIED = "not_modified"
+CACHE_RESULTS = (CACHE_HIT, CACHE_MISS, CACHE_NOT_MODIFIED)
+
+
+def _get_version(label):
+    # Версия - время последнего изменения каталога, она же отдаётся в Last-Modified
+    version = cache.get(VERSION_KEY.format(label=label))
+    if version is None:
+        version = int(time.time())
+        if not cache.add(VERSION_KEY.format(label=label), version, timeout=None):
+            version = cache.get(VERSION_KEY.format(label=label), version)
+    return version
+
+
+def bump_catalog_version(model):
+    """Сбрасывает кэш списков модели после фиксации текущей транзакции."""
+    label = model._meta.label_lower
+
+    def bump():
+        try:
+            key = VERSION_KEY.format(label=label)
+            version = max(int(time.time()), (cache.get(key) or 0) + 1)
+            cache.set(key, version, timeout=None)
+        except Exception as e:
+            logger.warning(f"Не удалось сбросить кеш каталога {label}: {e}")
+
+    transaction.on_commit(bump)
+
+
+def _get_signature(query_params):
+    params = sorted((key, sorted(values)) for key, values in query_params.lists() if any(values))
+    return hashlib.sha1(json.dumps(params, ensure_ascii=False).encode()).hexdigest()
+
+
+def _count(label, result):
+    # Метрики не должны ломать ответ: ошибка кеша между get и incr только пишется в лог
+    key = METRICS_KEY.format(label=label, result=result)
+    try:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+    except Exception as e:
+        logger.warning(f"Не удалось обновить метрику кеша каталога {label}: {e}")
+
+
+def get_cache_metrics(models):
+    metrics = {}
+    for model in models:
+        label = model._meta.label_lower
+        counts = cache.get_many([METRICS_KEY.format(label=label, result=result) for result in CACHE_RESULTS])
+        metrics[label] = {
+            result: counts.get(METRICS_KEY.format(label=label, result=result), 0) for result in CACHE_RESULTS
+        }
+    return metrics
+
+
+def _not_modified(request, etag, version):
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+    if_modified_since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return if_modified_since is not None and version <= if_modified_since
+
+
+def _cached_response(data, etag, version, result, response_status=status.HTTP_200_OK):
+    response = Response(data, status=response_status)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(version)
+    response["X-Cache"] = result.upper()
+    return response
+
+
+def cache_anonymous_response(model):
+    """
+    Кэш ответов списка для анонимных посетителей: ключ из нормализованных query-параметров
+    и версии каталога модели, с ETag/Last-Modified для ответа 304.
+    """
+    label = model._meta.label_lower
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def _wrapped_view(self, request, *args, **kwargs):
+            if request.user and request.user.is_authenticated:
+                return view_method(self, request, *args, **kwargs)
+
+            try:
+                version = _get_version(label)
+                key = RESPONSE_KEY.format(label=label, version=version, signature=_get_signature(request.query_params))
+                cached = cache.get(key)
+            except Exception as e:
+                logger.warning(f"Кеш каталога недоступен: {e}")
+                return view_method(self, request, *args, **kwargs)
+
+            if cached is not None:
+                data, etag = cached
+                result = CACHE_NOT_MODIFIED if _not_modified(request, etag, version) else CACHE_HIT
+                _count(label, result)
+
+                if result == CACHE_NOT_MODIFIED:
+                    return _cached_response(None, etag, version, result, status.HTTP_304_NOT_MODIFIED)
+                return _cached_response(data, etag, version, result)
+
+            response = view_method(self, request, *args, **kwargs)
+
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+            etag = '"%s"' % hashlib.md5(
+                json.dumps(response.data, sort_keys=True, default=str).encode()
+            ).hexdigest()
+
+            try:
+                cache.set(key, (response.data, etag), timeout=CATALOG_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Не удалось сохранить ответ в кеш каталога: {e}")
+
+            _count(label, CACHE_MISS)
+
+            if _not_modified(request, etag, version):
+                return _cached_response(None, etag, version, CACHE_MISS, status.HTTP_304_NOT_MODIFIED)
+
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(version)
+            response["X-Cache"] = CACHE_MISS.upper()
+            return response
+
+        return _wrapped_view
+
+    return decorator
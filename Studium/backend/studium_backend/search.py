@@ -0,0 +1,63 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce
+
+SEARCH_CONFIG = "russian"
+SEARCH_QUERY_PARAM = "q"
+MAX_QUERY_LENGTH = 200
+
+# Вес поля в tsvector: A - название, B - предмет и тип, C - учебные данные, D - описание
+SEARCH_WEIGHTS = {
+    "name": "A",
+    "discipline": "B",
+    "type": "B",
+    "tutor": "C",
+    "university": "C",
+    "faculty": "C",
+    "direction": "C",
+    "city": "C",
+    "level": "C",
+    "description": "D",
+}
+
+SEARCH_FIELDS = tuple(SEARCH_WEIGHTS)
+
+
+def build_search_vector():
+    vector = None
+    for field, weight in SEARCH_WEIGHTS.items():
+        part = SearchVector(Coalesce(field, Value("")), weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vector(model, pk):
+    model.objects.filter(pk=pk).update(search_vector=build_search_vector())
+
+
+def is_search_update(created, update_fields):
+    if created or not update_fields:
+        return True
+    return any(field in SEARCH_WEIGHTS for field in update_fields)
+
+
+def get_search_text(search_data):
+    text = (search_data.get(SEARCH_QUERY_PARAM) or "").strip()
+    return text[:MAX_QUERY_LENGTH]
+
+
+def apply_search(queryset, text, order_by_rank=True):
+    """Полнотекстовый поиск по search_vector с добором по триграммам названия для опечаток."""
+    if not text:
+        return queryset
+
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+
+    queryset = queryset.annotate(
+        search_rank=SearchRank(F("search_vector"), query) + TrigramWordSimilarity(text, "name"),
+    ).filter(Q(search_vector=query) | Q(name__trigram_word_similar=text))
+
+    if order_by_rank:
+        queryset = queryset.order_by("-search_rank", "-id")
+
+    return queryset
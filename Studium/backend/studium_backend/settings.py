@@ -59,6 +59,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'csp',
     'rest_framework',
@@ -220,6 +221,15 @@ REDIS_PORT = os.environ.get('REDIS_PORT', '6379')
 
 REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f"redis://{REDIS_HOST}:{REDIS_PORT}/1",
+        'KEY_PREFIX': 'studium',
+        'TIMEOUT': 300,
+    }
+}
+
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
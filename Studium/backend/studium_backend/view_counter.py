@@ -0,0 +1,108 @@
+import logging
+
+import redis
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounterService:
+    """
+    Просмотры копятся в Redis (HINCRBY по id) и периодически одним UPDATE переносятся в Postgres,
+    чтобы популярные работы не блокировали строку на каждом просмотре.
+    """
+    PENDING_KEY = "views:{label}:pending"
+    FLUSHING_KEY = "views:{label}:flushing"
+    FLUSH_LOCK_KEY = "views:{label}:flush_lock"
+    FLUSH_LOCK_TIMEOUT = 300
+    FLUSH_BATCH_SIZE = 1000
+
+    def __init__(self):
+        self.redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    def increment(self, instance):
+        """Засчитывает просмотр и возвращает число просмотров с учётом ещё не перенесённых в БД."""
+        label = instance._meta.label_lower
+
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.hincrby(self.PENDING_KEY.format(label=label), instance.pk, 1)
+            pipe.hget(self.FLUSHING_KEY.format(label=label), instance.pk)
+            pending, flushing = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Счётчик просмотров недоступен, запись напрямую в БД: {e}")
+            type(instance).objects.filter(pk=instance.pk).update(views=F('views') + 1)
+            instance.refresh_from_db(fields=['views'])
+            return instance.views
+
+        return instance.views + int(pending) + int(flushing or 0)
+
+    def flush(self, model):
+        """Переносит накопленные просмотры модели в БД, возвращает число обновлённых строк."""
+        label = model._meta.label_lower
+
+        # Перекрывающиеся запуски по расписанию не переносят одни и те же просмотры дважды
+        lock = self.redis_client.lock(self.FLUSH_LOCK_KEY.format(label=label), timeout=self.FLUSH_LOCK_TIMEOUT)
+        if not lock.acquire(blocking=False):
+            return 0
+
+        try:
+            return self._flush(model, label)
+        finally:
+            try:
+                lock.release()
+            except redis.exceptions.LockError:
+                logger.warning(f"Блокировка переноса просмотров {label} истекла до завершения")
+
+    def _flush(self, model, label):
+        pending_key = self.PENDING_KEY.format(label=label)
+        flushing_key = self.FLUSHING_KEY.format(label=label)
+
+        # Остаток прошлого неудачного переноса обрабатывается до новых просмотров
+        if not self.redis_client.exists(flushing_key):
+            try:
+                self.redis_client.rename(pending_key, flushing_key)
+            except redis.ResponseError:
+                return 0
+
+        # Ключ удаляется до записи в БД: после сбоя между COMMIT и удалением просмотры не применятся повторно
+        pipe = self.redis_client.pipeline()
+        pipe.hgetall(flushing_key)
+        pipe.delete(flushing_key)
+        flushing, _ = pipe.execute()
+        deltas = [(int(pk), int(delta)) for pk, delta in flushing.items()]
+
+        try:
+            with transaction.atomic():
+                for start in range(0, len(deltas), self.FLUSH_BATCH_SIZE):
+                    self._apply_deltas(model, deltas[start:start + self.FLUSH_BATCH_SIZE])
+        except Exception:
+            self._restore(flushing_key, deltas)
+            raise
+
+        return len(deltas)
+
+    def _restore(self, flushing_key, deltas):
+        """Возвращает неперенесённые просмотры в Redis, чтобы следующий запуск повторил перенос."""
+        pipe = self.redis_client.pipeline()
+        for pk, delta in deltas:
+            pipe.hincrby(flushing_key, pk, delta)
+        pipe.execute()
+
+    @staticmethod
+    def _apply_deltas(model, deltas):
+        table = connection.ops.quote_name(model._meta.db_table)
+        values = ", ".join(["(%s, %s)"] * len(deltas))
+        params = [value for delta in deltas for value in delta]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} AS t SET views = t.views + v.delta "
+                f"FROM (VALUES {values}) AS v(id, delta) WHERE t.id = v.id",
+                params,
+            )
+
+
+view_counter = ViewCounterService()
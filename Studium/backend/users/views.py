@@ -16,6 +16,7 @@ from authentication.models import CustomUser
 from storage.mixins import FileUploadMixin, PublicGetMixin
 
 from studium_backend.decorators import catch_and_log_exceptions
+from studium_backend.pagination import is_cursor_request, paginate_by_cursor
 
 from .serializers import UserSerializer, ShortInfoUserSerializer, PublicUserSerializer
 
@@ -188,10 +189,23 @@ class UsersListAPIView(PublicGetMixin, generics.ListAPIView):
     def _validate_pagination_params(page: int, page_size: int) -> bool:
         return page >= 1 and page_size > 0
 
+    def _serialize_users(self, users):
+        users_data = self.get_serializer(users, many=True).data
+
+        for user_data in users_data:
+            avatar = user_data.get('avatar')
+            if avatar:
+                user_data['avatar'] = self.handle_get_file(object_key=avatar)
+
+        return users_data
+
     @catch_and_log_exceptions
     def get(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        total_count = queryset.count()
+
+        if is_cursor_request(request.query_params):
+            rows, page_info = paginate_by_cursor(queryset, request.query_params)
+            return Response({"page_data": self._serialize_users(rows), **page_info})
 
         page = int(request.query_params.get("page", 1))
         page_size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
@@ -203,18 +217,9 @@ class UsersListAPIView(PublicGetMixin, generics.ListAPIView):
 
         paginated_queryset = paginator.page(page)
 
-        serializer = self.get_serializer(paginated_queryset, many=True)
-        users_data = serializer.data
-
-        for user_data in users_data:
-            avatar = user_data.get('avatar')
-            if avatar:
-                user_data['avatar'] = self.handle_get_file(object_key=avatar)
-
         return Response({
-            "total_count": total_count,
-            "page_data": users_data,
+            "total_count": paginator.count,
+            "page_data": self._serialize_users(paginated_queryset),
             "has_next": paginated_queryset.has_next(),
             "has_previous": paginated_queryset.has_previous(),
         })
-
@@ -0,0 +1,56 @@
+import argparse
+import time
+
+import numpy as np
+
+from route_planner import *
+
+STOP_COUNTS = [50, 500, 5000]
+WAREHOUSE_SIZE = 200
+TIME_LIMIT = 30.0
+
+
+def _measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmarkRoutes(stopCounts, timeLimit=TIME_LIMIT, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for stops in stopCounts:
+        points = rng.integers(0, WAREHOUSE_SIZE, size=(stops, 2))
+
+        matrix, matrixTime = _measure(manhattanMatrix, points)
+        seedRoute, seedTime = _measure(nearestNeighbourRoute, matrix)
+        route, planTime = _measure(planRoute, matrix, timeLimit=timeLimit)
+        commands, commandsTime = _measure(routeCommands, route, points)
+
+        results.append({
+            "stops": stops,
+            "matrixTime": matrixTime,
+            "seedTime": seedTime,
+            "planTime": planTime,
+            "commandsTime": commandsTime,
+            "seedLength": routeLength(seedRoute, matrix),
+            "routeLength": routeLength(route, matrix),
+            "commands": len(commands),
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser(description="Route planner benchmarks")
+    argParser.add_argument("stops", type=int, nargs="*", default=STOP_COUNTS)
+    argParser.add_argument("--time-limit", type=float, default=TIME_LIMIT)
+    args = argParser.parse_args()
+
+    print("%8s %10s %10s %10s %12s %12s %10s" % ("stops", "matrix,s", "nn,s", "2opt+or,s", "nn length",
+                                                 "length", "commands"))
+    for result in benchmarkRoutes(args.stops, args.time_limit):
+        print("%8d %10.3f %10.3f %10.2f %12.0f %12.0f %10d" % (
+            result["stops"], result["matrixTime"], result["seedTime"], result["planTime"],
+            result["seedLength"], result["routeLength"], result["commands"]))
@@ -0,0 +1,131 @@
+import time
+from collections import OrderedDict, deque
+
+DEFAULT_WINDOW = 8
+DEFAULT_TIMEOUT = 0.5
+DEFAULT_RETRIES = 3
+SEQ_MODULO = 256
+# Окно задаётся в пространстве номеров: все команды в полёте лежат в window подряд идущих номерах,
+# поэтому повтор отличается от новой команды по расстоянию до последнего номера меньше MAX_WINDOW
+MAX_WINDOW = SEQ_MODULO // 2
+LATENCY_HISTORY = 1024
+
+
+class CommandScheduler:
+    """
+    Конвейер команд: номера, окно команд в полёте, сопоставление подтверждений, таймауты и повторы.
+    Повтор уходит с тем же номером, по нему устройство отбрасывает уже выполненную команду.
+    """
+
+    def __init__(self, send, window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 onFailed=None, clock=time.monotonic):
+        if not 0 < window <= MAX_WINDOW:
+            raise ValueError("window must be in 1..%d" % MAX_WINDOW)
+
+        self.send = send
+        self.window = window
+        self.timeout = timeout
+        self.retries = retries
+        self.onFailed = onFailed
+        self.clock = clock
+
+        self.nextSeq = 0
+        self.queued = deque()
+        self.inFlight = OrderedDict()
+
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.acked = 0
+        self.retransmits = 0
+        self.failed = 0
+        self.unmatched = 0
+
+    def submit(self, values):
+        self.queued.append(tuple(values))
+        self.fill()
+
+    def submitMany(self, commands):
+        for values in commands:
+            self.submit(values)
+
+    def _windowFull(self):
+        # Самая старая команда в полёте первая в OrderedDict: повтор не меняет её места.
+        # Пока она ждёт подтверждения, новые номера не уходят дальше чем на window от неё
+        if not self.inFlight:
+            return False
+
+        oldestSeq = next(iter(self.inFlight))
+        return (self.nextSeq - oldestSeq) % SEQ_MODULO >= self.window
+
+    def fill(self):
+        while self.queued and not self._windowFull():
+            seq = self.nextSeq
+            self.nextSeq = (self.nextSeq + 1) % SEQ_MODULO
+            self._transmit(seq, self.queued.popleft(), attempt=0)
+
+    def _transmit(self, seq, values, attempt, firstSent=None):
+        now = self.clock()
+        self.inFlight[seq] = [values, now if firstSent is None else firstSent, now, attempt]
+        self.send(values, seq)
+
+    def onAck(self, seq):
+        entry = self.inFlight.pop(seq, None)
+
+        if entry is None:
+            self.unmatched += 1
+            return None
+
+        values, firstSent, lastSent, attempt = entry
+        self.acked += 1
+
+        # Задержка учитывается только без повторов: иначе неясно, на какую отправку пришёл ответ
+        if attempt == 0:
+            self.latencies.append(self.clock() - lastSent)
+
+        self.fill()
+        return seq
+
+    def poll(self):
+        now = self.clock()
+        expired = [seq for seq, (_, _, lastSent, _) in self.inFlight.items() if now - lastSent >= self.timeout]
+
+        for seq in expired:
+            values, firstSent, lastSent, attempt = self.inFlight[seq]
+
+            if attempt < self.retries:
+                self.retransmits += 1
+                self._transmit(seq, values, attempt + 1, firstSent)
+            else:
+                del self.inFlight[seq]
+                self.failed += 1
+                if self.onFailed:
+                    self.onFailed(seq, values)
+
+        self.fill()
+
+    def isIdle(self):
+        return not self.queued and not self.inFlight
+
+    def clear(self):
+        self.queued.clear()
+        self.inFlight.clear()
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+
+        def percentile(fraction):
+            return latencies[min(count - 1, int(fraction * count))] if count else None
+
+        return {
+            "acked": self.acked,
+            "inFlight": len(self.inFlight),
+            "queued": len(self.queued),
+            "retransmits": self.retransmits,
+            "failed": self.failed,
+            "unmatched": self.unmatched,
+            "rttMin": latencies[0] if count else None,
+            "rttMean": sum(latencies) / count if count else None,
+            "rttP50": percentile(0.5),
+            "rttP95": percentile(0.95),
+            "rttMax": latencies[-1] if count else None,
+        }
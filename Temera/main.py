@@ -1,17 +1,28 @@
+import array
+import sys
+
 from PyQt5 import QtWidgets, uic
-from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
-from PyQt5.QtCore import QIODevice
+from PyQt5.QtSerialPort import QSerialPortInfo
 
+from protocol import *
+from serial_worker import startSerialWorker, stopSerialWorker
+from session import SessionRecorder
+from telemetry import TelemetryBuffer
 
 
 i = 0
 distances = array.array('d',[0,0,0])
+telemetry = TelemetryBuffer(channels=len(distances))
+connected = False
+commandStats = {}
 
 app = QtWidgets.QApplication([])
 ui = uic.loadUi("CrabControlls.ui")
 
-serial = QSerialPort()
-serial.setBaudRate(115200)
+protocol = PROTOCOL_BINARY if "--binary" in sys.argv else PROTOCOL_TEXT
+recorder = SessionRecorder(sys.argv[sys.argv.index("--record") + 1]) if "--record" in sys.argv else None
+serialThread, serialWorker = startSerialWorker(protocol, recorder=recorder)
+
 portList = []
 ports = QSerialPortInfo().availablePorts()
 for port in ports:
@@ -19,30 +30,44 @@ for port in ports:
 ui.portComboBox.addItems(portList)
 
 def onConnect():
-    serial.setPortName(ui.portComboBox.currentText())
-    serial.open(QIODevice.ReadWrite)
-    checkConnect()
+    serialWorker.openRequested.emit(ui.portComboBox.currentText())
 
 def onDisconnect():
-    serial.close()
+    serialWorker.closeRequested.emit()
+
+def onConnectionChanged(isOpen):
+    global connected
+    connected = isOpen
     checkConnect()
 
 def checkConnect():
-    if (serial.isOpen()):
+    if (connected):
         ui.checkConBox.setCheckState(1)
     else:
         ui.checkConBox.setCheckState(0)
 
 def distReqest():
-    request = ("0,0,0,1,0;");
-    serial.write(request.encode())
+    serialWorker.sendCommand((0, 0, 0, 1, 0))
+
+
+def onSamples(frames):
+    for frameType, seq, data in frames:
+        if frameType != FRAME_DISTANCES or len(data) != len(distances):
+            continue
+        telemetry.append(data)
+        distances[:] = array.array('d', data)
+
+def onCommandStats(stats):
+    global commandStats
+    commandStats = stats
 
+def onCommandFailed(seq, values):
+    print("Команда %d %s не подтверждена" % (seq, values), file=sys.stderr)
 
-def readPort():
-    readBytes = serial.readLine()
-    readBytes = str(readBytes, 'UTF-8').strip()
-    data = readBytes.split(',')
-    print(data)
+def onQuit():
+    stopSerialWorker(serialThread, serialWorker)
+    if recorder:
+        recorder.close()
 
 
 
@@ -53,7 +78,11 @@ ui.distReqBttn.clicked.connect(distReqest)
 
 ui.checkConBox.clicked.connect(checkConnect)
 
-serial.readyRead.connect(readPort)
+serialWorker.connectionChanged.connect(onConnectionChanged)
+serialWorker.samplesReady.connect(onSamples)
+serialWorker.statsReady.connect(onCommandStats)
+serialWorker.commandFailed.connect(onCommandFailed)
+app.aboutToQuit.connect(onQuit)
 
 ui.show()
-app.exec()
\ No newline at end of file
+app.exec()
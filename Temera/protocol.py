@@ -0,0 +1,196 @@
+import binascii
+import struct
+
+# Бинарный кадр: SYNC(2) | тип(1) | номер(1) | длина(2, LE) | данные | CRC-16/CCITT(2, LE)
+SYNC = b"\xa5\x5a"
+HEADER = struct.Struct("<2sBBH")
+CRC = struct.Struct("<H")
+HEADER_SIZE = HEADER.size
+CRC_SIZE = CRC.size
+MAX_PAYLOAD = 1024
+
+FRAME_COMMAND = 0x01
+FRAME_DISTANCES = 0x02
+FRAME_ACK = 0x03 # Подтверждение команды, номер кадра совпадает с номером команды
+
+COMMAND_FIELDS = 5
+COMMAND = struct.Struct("<%dh" % COMMAND_FIELDS)
+DISTANCE = struct.Struct("<f")
+
+TEXT_COMMAND_END = b";"
+TEXT_LINE_END = b"\n"
+
+PROTOCOL_TEXT = "text"
+PROTOCOL_BINARY = "binary"
+
+
+def crc16(data, crc=0xFFFF):
+    return binascii.crc_hqx(data, crc)
+
+
+def encodeFrame(frameType, payload, seq=0):
+    header = HEADER.pack(SYNC, frameType, seq & 0xFF, len(payload))
+    return header + payload + CRC.pack(crc16(payload, crc16(header[2:])))
+
+
+def encodeCommand(values, seq=0):
+    return encodeFrame(FRAME_COMMAND, COMMAND.pack(*values), seq)
+
+
+def encodeDistances(values, seq=0):
+    return encodeFrame(FRAME_DISTANCES, struct.pack("<%df" % len(values), *values), seq)
+
+
+def encodeAck(seq):
+    return encodeFrame(FRAME_ACK, b"", seq)
+
+
+def encodeTextCommand(values):
+    return (",".join(str(value) for value in values)).encode() + TEXT_COMMAND_END
+
+
+def encodeTextDistances(values):
+    return (",".join(str(value) for value in values)).encode() + TEXT_LINE_END
+
+
+def isValidPayload(frameType, length):
+    """Длина данных должна соответствовать типу кадра, неизвестные типы не разбираются."""
+    if frameType == FRAME_ACK:
+        return length == 0
+
+    if frameType == FRAME_COMMAND:
+        return length == COMMAND.size
+
+    if frameType == FRAME_DISTANCES:
+        return length % DISTANCE.size == 0
+
+    return False
+
+
+def decodePayload(frameType, buffer, offset, length):
+    if frameType == FRAME_ACK:
+        return ()
+
+    if frameType == FRAME_COMMAND:
+        return COMMAND.unpack_from(buffer, offset)
+
+    return struct.unpack_from("<%df" % (length // DISTANCE.size), buffer, offset)
+
+
+class FrameParser:
+    """Инкрементальный разбор бинарных кадров из одного переиспользуемого буфера."""
+
+    protocol = PROTOCOL_BINARY
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.crcErrors = 0
+        self.droppedBytes = 0
+        self.badFrames = 0
+
+    def feed(self, data):
+        self.buffer += data
+        return self.parse()
+
+    def parse(self):
+        frames = []
+        buffer = self.buffer
+        view = memoryview(buffer)
+        offset = 0
+
+        try:
+            while True:
+                start = buffer.find(SYNC, offset)
+
+                if start < 0:
+                    # Последний байт может оказаться началом SYNC следующей порции
+                    # Уже разобранный последний байт кадра не возвращается, даже если равен 0xA5
+                    keep = 1 if offset < len(buffer) and buffer[-1:] == SYNC[:1] else 0
+                    self.droppedBytes += len(buffer) - offset - keep
+                    offset = len(buffer) - keep
+                    break
+
+                self.droppedBytes += start - offset
+                offset = start
+
+                if len(buffer) - offset < HEADER_SIZE:
+                    break
+
+                _, frameType, seq, length = HEADER.unpack_from(buffer, offset)
+
+                if length > MAX_PAYLOAD:
+                    self.droppedBytes += 1
+                    offset += 1
+                    continue
+
+                end = offset + HEADER_SIZE + length
+
+                if len(buffer) < end + CRC_SIZE:
+                    break
+
+                crc = crc16(view[end - length:end], crc16(view[offset + 2:offset + HEADER_SIZE]))
+
+                if crc != CRC.unpack_from(buffer, end)[0]:
+                    self.crcErrors += 1
+                    offset += 1
+                    continue
+
+                if isValidPayload(frameType, length):
+                    frames.append((frameType, seq, decodePayload(frameType, buffer, end - length, length)))
+                else:
+                    # CRC сошёлся, значит кадр целый: он пропускается полностью, а не разбирается заново со сдвигом
+                    self.badFrames += 1
+
+                offset = end + CRC_SIZE
+        finally:
+            view.release()
+            del buffer[:offset]
+
+        return frames
+
+
+class TextParser:
+    """Разбор текстового протокола с сохранением неполной строки до следующей порции."""
+
+    protocol = PROTOCOL_TEXT
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.badLines = 0
+
+    def feed(self, data):
+        self.buffer += data
+        return self.parse()
+
+    def parse(self):
+        frames = []
+        buffer = self.buffer
+        end = buffer.rfind(TEXT_LINE_END)
+
+        if end < 0:
+            return frames
+
+        for line in bytes(buffer[:end]).split(TEXT_LINE_END):
+            line = line.strip()
+
+            if not line:
+                continue
+
+            try:
+                frames.append((FRAME_DISTANCES, 0, tuple(float(value) for value in line.split(b","))))
+            except ValueError:
+                self.badLines += 1
+
+        del buffer[:end + 1]
+        return frames
+
+
+def createParser(protocol):
+    return FrameParser() if protocol == PROTOCOL_BINARY else TextParser()
+
+
+def encodeRequest(protocol, values, seq=0):
+    if protocol == PROTOCOL_BINARY:
+        return encodeCommand(values, seq)
+
+    return encodeTextCommand(values)
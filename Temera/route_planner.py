@@ -0,0 +1,263 @@
+import time
+
+import numpy as np
+
+FREE = 0
+BLOCKED = 1
+
+# Поля команды "a,b,c,d,e;": смещение по X, смещение по Y, не используется, запрос расстояния, не используется
+MOVE_X = 0
+MOVE_Y = 1
+MEASURE = 3
+COMMAND_FIELDS = 5
+
+EPSILON = 1e-9
+OR_OPT_SEGMENTS = (1, 2, 3)
+
+
+def manhattanMatrix(points):
+    points = np.asarray(points, dtype=np.float64)
+    matrix = np.abs(np.subtract.outer(points[:, 0], points[:, 0]))
+    matrix += np.abs(np.subtract.outer(points[:, 1], points[:, 1]))
+    return matrix
+
+
+def gridDistances(grid, source):
+    """Расстояния BFS от клетки source до всех клеток сетки, -1 для недостижимых."""
+    grid = np.asarray(grid)
+    free = grid == FREE
+    distances = np.full(grid.shape, -1, dtype=np.int64)
+
+    frontier = np.zeros(grid.shape, dtype=bool)
+    frontier[source] = True
+    distances[source] = 0
+    step = 0
+
+    while frontier.any():
+        step += 1
+        reached = np.zeros_like(frontier)
+        reached[1:, :] |= frontier[:-1, :]
+        reached[:-1, :] |= frontier[1:, :]
+        reached[:, 1:] |= frontier[:, :-1]
+        reached[:, :-1] |= frontier[:, 1:]
+
+        frontier = reached & free & (distances < 0)
+        distances[frontier] = step
+
+    return distances
+
+
+def gridMatrix(grid, points):
+    rows, cols = np.asarray(points).T
+    matrix = np.empty((len(points), len(points)), dtype=np.float64)
+
+    for index, point in enumerate(points):
+        distances = gridDistances(grid, tuple(point))
+        matrix[index] = distances[rows, cols]
+
+    if (matrix < 0).any():
+        raise ValueError("some pick locations are unreachable")
+
+    return matrix
+
+
+def routeLength(route, matrix):
+    route = np.asarray(route)
+    return float(matrix[route, np.roll(route, -1)].sum())
+
+
+def nearestNeighbourRoute(matrix, start=0):
+    size = len(matrix)
+    visited = np.zeros(size, dtype=bool)
+    route = np.empty(size, dtype=np.int64)
+
+    current = start
+    for position in range(size):
+        route[position] = current
+        visited[current] = True
+
+        if position == size - 1:
+            break
+
+        candidates = np.where(visited, np.inf, matrix[current])
+        current = int(candidates.argmin())
+
+    return route
+
+
+def twoOpt(route, matrix, maxPasses=50, deadline=None):
+    route = np.array(route, dtype=np.int64)
+    size = len(route)
+
+    if size < 4:
+        return route
+
+    for _ in range(maxPasses):
+        improved = False
+
+        for i in range(size - 2):
+            if deadline is not None and time.perf_counter() > deadline:
+                return route
+
+            a, b = route[i], route[i + 1]
+            c = route[i + 2:]
+            d = np.append(route[i + 3:], route[0])
+
+            # Рёбра (a, b) и (c, d) заменяются на (a, c) и (b, d)
+            delta = matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d]
+
+            if i == 0:
+                delta[-1] = 0.0
+
+            j = int(delta.argmin())
+
+            if delta[j] < -EPSILON:
+                j += i + 2
+                route[i + 1:j + 1] = route[i + 1:j + 1][::-1].copy()
+                improved = True
+
+        if not improved:
+            break
+
+    return route
+
+
+def orOpt(route, matrix, maxPasses=20, deadline=None):
+    route = np.array(route, dtype=np.int64)
+    size = len(route)
+
+    if size < 5:
+        return route
+
+    for _ in range(maxPasses):
+        improved = False
+
+        for length in OR_OPT_SEGMENTS:
+            i = 1
+            while i + length <= size:
+                if deadline is not None and time.perf_counter() > deadline:
+                    return route
+
+                # Отрезок route[i:i + length] переносится между другими соседними точками маршрута
+                first, last = route[i], route[i + length - 1]
+                prev, after = route[i - 1], route[(i + length) % size]
+                removeGain = matrix[prev, first] + matrix[last, after] - matrix[prev, after]
+
+                rest = np.concatenate((route[:i], route[i + length:]))
+                nextRest = np.roll(rest, -1)
+                insertCost = matrix[rest, first] + matrix[last, nextRest] - matrix[rest, nextRest]
+                reversedCost = matrix[rest, last] + matrix[first, nextRest] - matrix[rest, nextRest]
+
+                best = int(insertCost.argmin())
+                bestReversed = int(reversedCost.argmin())
+                segment = route[i:i + length].copy()
+
+                if reversedCost[bestReversed] < insertCost[best]:
+                    best, cost, segment = bestReversed, reversedCost[bestReversed], segment[::-1]
+                else:
+                    cost = insertCost[best]
+
+                if cost - removeGain < -EPSILON:
+                    route = np.concatenate((rest[:best + 1], segment, rest[best + 1:]))
+                    improved = True
+                else:
+                    i += 1
+
+        if not improved:
+            break
+
+    return route
+
+
+def planRoute(matrix, start=0, timeLimit=None, maxPasses=50):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    deadline = time.perf_counter() + timeLimit if timeLimit else None
+
+    route = nearestNeighbourRoute(matrix, start)
+
+    while True:
+        length = routeLength(route, matrix)
+        route = twoOpt(route, matrix, maxPasses=maxPasses, deadline=deadline)
+        route = orOpt(route, matrix, maxPasses=maxPasses, deadline=deadline)
+
+        if routeLength(route, matrix) >= length - EPSILON:
+            break
+
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+
+    # Маршрут всегда начинается со стартовой точки
+    shift = int(np.flatnonzero(route == start)[0])
+    return np.roll(route, -shift)
+
+
+def gridPath(grid, source, target):
+    distances = gridDistances(grid, target)
+
+    if distances[source] < 0:
+        raise ValueError("target is unreachable")
+
+    path = [source]
+    row, col = source
+
+    while (row, col) != tuple(target):
+        for nextRow, nextCol in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= nextRow < distances.shape[0] and 0 <= nextCol < distances.shape[1] \
+                    and distances[nextRow, nextCol] == distances[row, col] - 1:
+                row, col = nextRow, nextCol
+                break
+        path.append((row, col))
+
+    return path
+
+
+def moveCommand(dx, dy):
+    command = [0] * COMMAND_FIELDS
+    command[MOVE_X] = dx
+    command[MOVE_Y] = dy
+    return tuple(command)
+
+
+def measureCommand():
+    command = [0] * COMMAND_FIELDS
+    command[MEASURE] = 1
+    return tuple(command)
+
+
+def _pathMoves(path):
+    moves = []
+    lastStep = None
+
+    for (row, col), (nextRow, nextCol) in zip(path, path[1:]):
+        step = (nextCol - col, nextRow - row)
+
+        # Подряд идущие шаги в одном направлении сливаются в одну команду
+        if step == lastStep:
+            moves[-1] = (moves[-1][0] + step[0], moves[-1][1] + step[1])
+        else:
+            moves.append(step)
+            lastStep = step
+
+    return moves
+
+
+def routeCommands(route, points, grid=None, closed=True):
+    """Последовательность команд устройству: перемещения между точками и замер на каждой точке."""
+    points = [tuple(int(value) for value in point) for point in points]
+    order = list(route) + ([route[0]] if closed else [])
+    commands = []
+
+    for current, following in zip(order, order[1:]):
+        source, target = points[current], points[following]
+
+        if grid is not None:
+            moves = _pathMoves(gridPath(grid, source, target))
+        else:
+            moves = [(target[1] - source[1], 0), (0, target[0] - source[0])]
+
+        commands.extend(moveCommand(dx, dy) for dx, dy in moves if dx or dy)
+
+        if not closed or following != route[0]:
+            commands.append(measureCommand())
+
+    return commands
@@ -0,0 +1,165 @@
+import queue
+
+from PyQt5.QtCore import QIODevice, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtSerialPort import QSerialPort
+
+from command_scheduler import DEFAULT_RETRIES, DEFAULT_TIMEOUT, DEFAULT_WINDOW, CommandScheduler
+from protocol import *
+from session import DIRECTION_DEVICE, DIRECTION_HOST
+
+BAUD_RATE = 115200
+UI_REFRESH_MS = 50 # Не чаще 20 обновлений интерфейса в секунду
+POLL_MS = 10 # Шаг проверки таймаутов команд
+
+
+class SerialWorker(QObject):
+    """Владеет QSerialPort в отдельном потоке, пачками отдаёт разобранные кадры в GUI."""
+
+    samplesReady = pyqtSignal(list)
+    connectionChanged = pyqtSignal(bool)
+    commandFailed = pyqtSignal(int, tuple)
+    statsReady = pyqtSignal(dict)
+
+    openRequested = pyqtSignal(str)
+    closeRequested = pyqtSignal()
+    commandQueued = pyqtSignal()
+    stopRequested = pyqtSignal()
+
+    def __init__(self, protocol=PROTOCOL_TEXT, baudRate=BAUD_RATE, refreshMs=UI_REFRESH_MS, recorder=None,
+                 window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+        super().__init__()
+        self.protocol = protocol
+        self.recorder = recorder
+        self.baudRate = baudRate
+        self.refreshMs = refreshMs
+
+        self.parser = createParser(protocol)
+        self.commands = queue.SimpleQueue()
+        self.pending = []
+        self.scheduler = CommandScheduler(self.writeRequest, window, timeout, retries, onFailed=self.commandFailed.emit)
+        self.reportedAcks = 0
+
+        self.serial = None
+        self.timer = None
+        self.pollTimer = None
+
+        self.openRequested.connect(self.openPort)
+        self.closeRequested.connect(self.closePort)
+        self.commandQueued.connect(self.writeCommands)
+        self.stopRequested.connect(self.stop)
+
+    @pyqtSlot()
+    def start(self):
+        # Порт и таймер создаются уже в потоке воркера и живут в нём
+        self.serial = QSerialPort()
+        self.serial.setBaudRate(self.baudRate)
+        self.serial.readyRead.connect(self.readPort)
+
+        self.timer = QTimer()
+        self.timer.setInterval(self.refreshMs)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+        self.pollTimer = QTimer()
+        self.pollTimer.setInterval(POLL_MS)
+        self.pollTimer.timeout.connect(self.scheduler.poll)
+        self.pollTimer.start()
+
+    @pyqtSlot(str)
+    def openPort(self, portName):
+        if self.serial.isOpen():
+            self.serial.close()
+
+        self.serial.setPortName(portName)
+        self.serial.open(QIODevice.ReadWrite)
+        self.parser = createParser(self.protocol)
+        self.scheduler.clear()
+        self.connectionChanged.emit(self.serial.isOpen())
+
+    @pyqtSlot()
+    def closePort(self):
+        self.serial.close()
+        self.scheduler.clear()
+        self.connectionChanged.emit(False)
+
+    def sendCommand(self, values):
+        # Вызывается из любого потока: команда ставится в очередь, запись идёт в потоке воркера
+        self.commands.put(values)
+        self.commandQueued.emit()
+
+    def sendCommands(self, commands):
+        # Маршрут целиком: команды уходят окном, не дожидаясь ответа на каждую
+        for values in commands:
+            self.commands.put(values)
+        self.commandQueued.emit()
+
+    @pyqtSlot()
+    def writeCommands(self):
+        while True:
+            try:
+                values = self.commands.get_nowait()
+            except queue.Empty:
+                break
+
+            if not self.serial.isOpen():
+                continue
+
+            # Текстовая прошивка не подтверждает команды: они пишутся сразу, без окна и повторов
+            if self.protocol == PROTOCOL_BINARY:
+                self.scheduler.submit(values)
+            else:
+                self.writeRequest(values, 0)
+
+    def writeRequest(self, values, seq):
+        request = encodeRequest(self.protocol, values, seq)
+        self.serial.write(request)
+
+        if self.recorder:
+            self.recorder.write(DIRECTION_HOST, request)
+
+    @pyqtSlot()
+    def readPort(self):
+        data = self.serial.read(self.serial.bytesAvailable())
+
+        if self.recorder:
+            self.recorder.write(DIRECTION_DEVICE, data)
+
+        for frame in self.parser.feed(data):
+            if frame[0] == FRAME_ACK:
+                self.scheduler.onAck(frame[1])
+            else:
+                self.pending.append(frame)
+
+    @pyqtSlot()
+    def flush(self):
+        if self.pending:
+            batch, self.pending = self.pending, []
+            self.samplesReady.emit(batch)
+
+        if self.scheduler.acked != self.reportedAcks:
+            self.reportedAcks = self.scheduler.acked
+            self.statsReady.emit(self.scheduler.stats())
+
+    @pyqtSlot()
+    def stop(self):
+        self.timer.stop()
+        self.pollTimer.stop()
+        self.flush()
+        if self.serial.isOpen():
+            self.serial.close()
+        self.thread().quit()
+
+
+def startSerialWorker(protocol=PROTOCOL_TEXT, baudRate=BAUD_RATE, refreshMs=UI_REFRESH_MS, recorder=None,
+                      window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+    thread = QThread()
+    worker = SerialWorker(protocol, baudRate, refreshMs, recorder, window, timeout, retries)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.start)
+    thread.start()
+    return thread, worker
+
+
+def stopSerialWorker(thread, worker):
+    worker.stopRequested.emit()
+    thread.wait()
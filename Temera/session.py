@@ -0,0 +1,36 @@
+import struct
+import threading
+import time
+
+DIRECTION_DEVICE = 0
+DIRECTION_HOST = 1
+RECORD = struct.Struct("<dBI")
+
+
+class SessionRecorder:
+    """Запись сессии: (время от начала, направление, длина) и сырые байты."""
+
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.start = time.monotonic()
+        self.lock = threading.Lock()
+
+    def write(self, direction, data):
+        with self.lock:
+            self.file.write(RECORD.pack(time.monotonic() - self.start, direction, len(data)))
+            self.file.write(data)
+
+    def close(self):
+        self.file.close()
+
+
+def readSession(path):
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(RECORD.size)
+
+            if len(header) < RECORD.size:
+                return
+
+            timestamp, direction, length = RECORD.unpack(header)
+            yield timestamp, direction, file.read(length)
@@ -0,0 +1,299 @@
+import argparse
+import math
+import os
+import pty
+import random
+import select
+import threading
+import time
+import tty
+from collections import deque
+
+from command_scheduler import DEFAULT_WINDOW, MAX_WINDOW, SEQ_MODULO, CommandScheduler
+from protocol import *
+from session import *
+from telemetry import TelemetryBuffer
+
+DEFAULT_RATE = 100.0 # Показаний в секунду, как у прошивки
+CHANNELS = 3
+READ_SIZE = 65536
+
+
+def openPseudoPort():
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    return master, slave, os.ttyname(slave)
+
+
+class CrabSimulator:
+    """Программная замена контроллера: принимает команды "a,b,c,d,e;" и шлёт показания расстояний."""
+
+    def __init__(self, protocol=PROTOCOL_TEXT, rate=DEFAULT_RATE, recorder=None, seed=0):
+        self.protocol = protocol
+        self.rate = rate
+        self.recorder = recorder
+        self.random = random.Random(seed)
+
+        self.master, self.slave, self.portName = openPseudoPort()
+        self.commandParser = FrameParser() if protocol == PROTOCOL_BINARY else None
+        self.commandBuffer = bytearray()
+
+        self.commands = []
+        self.badCommands = 0
+        self.executedSeqs = deque(maxlen=MAX_WINDOW)
+        self.sent = 0
+        self.seq = 0
+        self.stopEvent = threading.Event()
+        self.thread = None
+
+    def reading(self):
+        phase = self.sent / max(self.rate, 1.0)
+        return tuple(round(500.0 + 300.0 * math.sin(phase + channel) + self.random.uniform(-5.0, 5.0), 1)
+                     for channel in range(CHANNELS))
+
+    def encodeReading(self, values):
+        self.seq = (self.seq + 1) & 0xFF
+
+        if self.protocol == PROTOCOL_BINARY:
+            return encodeDistances(values, self.seq)
+
+        return encodeTextDistances(values)
+
+    def write(self, data):
+        if self.recorder:
+            self.recorder.write(DIRECTION_DEVICE, data)
+        os.write(self.master, data)
+
+    def isRepeat(self, seq):
+        """
+        Повтор: номер среди последних выполненных и не дальше MAX_WINDOW позади последнего.
+        Окно планировщика держит номера в полёте в пределах MAX_WINDOW, поэтому номер,
+        снова выданный после круга, отстоит дальше и выполняется как новая команда.
+        """
+        if not self.executedSeqs:
+            return False
+
+        return seq in self.executedSeqs and (self.executedSeqs[-1] - seq) % SEQ_MODULO < MAX_WINDOW
+
+    def handleInput(self, data):
+        if self.recorder:
+            self.recorder.write(DIRECTION_HOST, data)
+
+        if self.commandParser:
+            commands = [(seq, values) for frameType, seq, values in self.commandParser.feed(data)
+                        if frameType == FRAME_COMMAND]
+        else:
+            self.commandBuffer += data
+            *lines, rest = bytes(self.commandBuffer).split(TEXT_COMMAND_END)
+            self.commandBuffer = bytearray(rest)
+            commands = []
+
+            for line in lines:
+                if not line.strip():
+                    continue
+
+                # Ошибочная команда пропускается и учитывается, а не останавливает поток симулятора
+                try:
+                    commands.append((0, tuple(int(value) for value in line.strip().split(b","))))
+                except ValueError:
+                    self.badCommands += 1
+
+        replies = []
+
+        for seq, command in commands:
+            if self.commandParser:
+                # Двоичная команда подтверждается, повтор с уже выполненным номером только подтверждается
+                replies.append(encodeAck(seq))
+                if self.isRepeat(seq):
+                    continue
+                self.executedSeqs.append(seq)
+
+            self.commands.append(command)
+
+            # Запрос расстояния обслуживается сразу, вне периодической отправки
+            if len(command) > 3 and command[3]:
+                replies.append(self.encodeReading(self.reading()))
+
+        if replies:
+            self.write(b"".join(replies))
+
+    def run(self, duration=None):
+        interval = 1.0 / self.rate if self.rate else None
+        start = time.monotonic()
+        nextSend = start
+
+        while not self.stopEvent.is_set():
+            now = time.monotonic()
+
+            if duration is not None and now - start >= duration:
+                break
+
+            timeout = max(nextSend - now, 0.0) if interval else 0.05
+            readable, _, _ = select.select([self.master], [], [], timeout)
+
+            if readable:
+                try:
+                    self.handleInput(os.read(self.master, READ_SIZE))
+                except OSError:
+                    break
+
+            if interval and time.monotonic() >= nextSend:
+                # Отставшие отправки догоняются пачкой, чтобы выдерживать заданную частоту
+                due = int((time.monotonic() - nextSend) / interval) + 1
+                chunk = b"".join(self.encodeReading(self.reading()) for _ in range(due))
+                self.sent += due
+                self.write(chunk)
+                nextSend += due * interval
+
+    def start(self, duration=None):
+        self.thread = threading.Thread(target=self.run, args=(duration,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopEvent.set()
+        if self.thread:
+            self.thread.join()
+
+    def close(self):
+        self.stop()
+        os.close(self.master)
+        os.close(self.slave)
+
+
+def replaySession(path, speed=1.0, master=None):
+    """Воспроизводит записанные данные устройства в псевдотерминал с ускорением speed."""
+    if master is None:
+        master, slave, portName = openPseudoPort()
+        print(portName, flush=True)
+
+    start = time.monotonic()
+
+    for timestamp, direction, data in readSession(path):
+        if direction != DIRECTION_DEVICE:
+            continue
+
+        delay = timestamp / speed - (time.monotonic() - start)
+        if delay > 0:
+            time.sleep(delay)
+
+        os.write(master, data)
+
+
+def benchmarkPipeline(protocol=PROTOCOL_TEXT, rate=DEFAULT_RATE * 10, duration=5.0, useWorker=False):
+    """Прогон симулятора через парсер и кольцевой буфер (или через SerialWorker) без железа."""
+    simulator = CrabSimulator(protocol, rate)
+    telemetry = TelemetryBuffer(channels=CHANNELS)
+    received = 0
+    batches = 0
+
+    simulator.start(duration)
+    start = time.monotonic()
+
+    if useWorker:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtCore import QCoreApplication, QTimer
+        from serial_worker import startSerialWorker, stopSerialWorker
+
+        app = QCoreApplication.instance() or QCoreApplication([])
+        thread, worker = startSerialWorker(protocol)
+
+        def onSamples(frames):
+            nonlocal received, batches
+            batches += 1
+            for frameType, seq, data in frames:
+                telemetry.append(data)
+            received += len(frames)
+
+        worker.samplesReady.connect(onSamples)
+        worker.openRequested.emit(simulator.portName)
+        QTimer.singleShot(int(duration * 1000) + 200, app.quit)
+        app.exec()
+        stopSerialWorker(thread, worker)
+    else:
+        parser = createParser(protocol)
+        deadline = start + duration + 0.2
+
+        while time.monotonic() < deadline:
+            readable, _, _ = select.select([simulator.slave], [], [], 0.05)
+            if not readable:
+                continue
+
+            frames = parser.feed(os.read(simulator.slave, READ_SIZE))
+            batches += 1
+            for frameType, seq, data in frames:
+                telemetry.append(data)
+            received += len(frames)
+
+    elapsed = time.monotonic() - start
+    simulator.close()
+
+    return {"sent": simulator.sent, "received": received, "batches": batches, "rate": received / elapsed}
+
+
+def benchmarkCommands(count=1000, window=DEFAULT_WINDOW, rate=DEFAULT_RATE):
+    """Отправка count двоичных команд через планировщик с окном window и замер задержки подтверждений."""
+    simulator = CrabSimulator(PROTOCOL_BINARY, rate)
+    parser = FrameParser()
+
+    def send(values, seq):
+        os.write(simulator.slave, encodeCommand(values, seq))
+
+    scheduler = CommandScheduler(send, window)
+    simulator.start()
+    start = time.monotonic()
+
+    scheduler.submitMany((1, 0, 0, 0, 0) if index % 2 else (0, 0, 0, 1, 0) for index in range(count))
+
+    while not scheduler.isIdle():
+        readable, _, _ = select.select([simulator.slave], [], [], 0.01)
+
+        if readable:
+            for frameType, seq, values in parser.feed(os.read(simulator.slave, READ_SIZE)):
+                if frameType == FRAME_ACK:
+                    scheduler.onAck(seq)
+
+        scheduler.poll()
+
+    elapsed = time.monotonic() - start
+    simulator.close()
+
+    stats = scheduler.stats()
+    stats["rate"] = count / elapsed
+    return stats
+
+
+if __name__ == '__main__':
+    argParser = argparse.ArgumentParser(description="Crab controller simulator")
+    argParser.add_argument("--binary", action="store_true", help="binary frames instead of text lines")
+    argParser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="readings per second")
+    argParser.add_argument("--duration", type=float, help="stop after N seconds")
+    argParser.add_argument("--record", help="record the session to a file")
+    argParser.add_argument("--replay", help="replay a recorded session instead of simulating")
+    argParser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier")
+    argParser.add_argument("--bench", action="store_true", help="benchmark parser and telemetry buffer")
+    argParser.add_argument("--bench-worker", action="store_true", help="benchmark through SerialWorker")
+    argParser.add_argument("--bench-commands", type=int,
+                           help="stream N commands through the command scheduler (binary protocol)")
+    argParser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="commands in flight for --bench-commands")
+    args = argParser.parse_args()
+
+    protocol = PROTOCOL_BINARY if args.binary else PROTOCOL_TEXT
+
+    if args.bench_commands:
+        print(benchmarkCommands(args.bench_commands, args.window, args.rate))
+    elif args.bench or args.bench_worker:
+        print(benchmarkPipeline(protocol, args.rate, args.duration or 5.0, args.bench_worker))
+    elif args.replay:
+        replaySession(args.replay, args.speed)
+    else:
+        recorder = SessionRecorder(args.record) if args.record else None
+        simulator = CrabSimulator(protocol, args.rate, recorder)
+        print(simulator.portName, flush=True)
+
+        try:
+            simulator.run(args.duration)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if recorder:
+                recorder.close()
@@ -0,0 +1,141 @@
+import array
+import math
+import time
+from collections import deque
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_CHANNELS = 3
+
+
+class TelemetryBuffer:
+    """Кольцевой буфер показаний датчиков фиксированного размера с окном скользящей статистики."""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, channels=DEFAULT_CHANNELS, window=None):
+        window = window or capacity
+
+        if not 0 < window <= capacity:
+            raise ValueError("window must be in 1..capacity")
+
+        self.capacity = capacity
+        self.channels = channels
+        self.window = window
+
+        self.timestamps = array.array('d', bytes(8 * capacity))
+        self.values = array.array('d', bytes(8 * capacity * channels))
+
+        self.total = 0
+        self.windowSums = [0.0] * channels
+        self.minQueues = [deque() for _ in range(channels)]
+        self.maxQueues = [deque() for _ in range(channels)]
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, values, timestamp=None):
+        if len(values) != self.channels:
+            raise ValueError("expected %d values, got %d" % (self.channels, len(values)))
+
+        sample = self.total
+        slot = sample % self.capacity
+        base = slot * self.channels
+        leaving = sample - self.window
+
+        if leaving >= 0:
+            # Выходящее из окна значение читается до перезаписи слота
+            leavingBase = (leaving % self.capacity) * self.channels
+            for channel in range(self.channels):
+                self.windowSums[channel] -= self.values[leavingBase + channel]
+
+        self.timestamps[slot] = time.monotonic() if timestamp is None else timestamp
+
+        for channel, value in enumerate(values):
+            self.values[base + channel] = value
+            self.windowSums[channel] += value
+
+            # Монотонные очереди: минимум и максимум окна за амортизированное O(1)
+            minQueue = self.minQueues[channel]
+            while minQueue and minQueue[-1][1] >= value:
+                minQueue.pop()
+            minQueue.append((sample, value))
+            if minQueue[0][0] <= leaving:
+                minQueue.popleft()
+
+            maxQueue = self.maxQueues[channel]
+            while maxQueue and maxQueue[-1][1] <= value:
+                maxQueue.pop()
+            maxQueue.append((sample, value))
+            if maxQueue[0][0] <= leaving:
+                maxQueue.popleft()
+
+        self.total += 1
+
+        if self.total % self.window == 0:
+            self._recomputeSums()
+
+    def _recomputeSums(self):
+        # Сумма с вычитаниями копит ошибку округления, поэтому раз в окно она считается заново через fsum:
+        # O(window) раз в window отсчётов, то есть O(1) в среднем на отсчёт
+        segments = self.segments(self.window)
+        self.windowSums = [
+            math.fsum(value for _, values in segments for value in values[channel::self.channels])
+            for channel in range(self.channels)
+        ]
+
+    def extend(self, samples, timestamp=None):
+        for values in samples:
+            self.append(values, timestamp)
+
+    def latest(self):
+        if not self.total:
+            return None
+
+        slot = (self.total - 1) % self.capacity
+        base = slot * self.channels
+        return self.timestamps[slot], tuple(self.values[base:base + self.channels])
+
+    def segments(self, count=None):
+        """Последние count отсчётов как один или два memoryview-сегмента (время, значения) без копирования."""
+        size = len(self)
+        count = size if count is None else min(count, size)
+
+        if not count:
+            return []
+
+        end = self.total % self.capacity or self.capacity
+        start = end - count
+        timestamps = memoryview(self.timestamps)
+        values = memoryview(self.values)
+        channels = self.channels
+
+        if start >= 0:
+            return [(timestamps[start:end], values[start * channels:end * channels])]
+
+        start += self.capacity
+        return [
+            (timestamps[start:], values[start * channels:]),
+            (timestamps[:end], values[:end * channels]),
+        ]
+
+    def windowSize(self):
+        return min(self.total, self.window)
+
+    def getMin(self, channel):
+        queue = self.minQueues[channel]
+        return queue[0][1] if queue else None
+
+    def getMax(self, channel):
+        queue = self.maxQueues[channel]
+        return queue[0][1] if queue else None
+
+    def getMean(self, channel):
+        size = self.windowSize()
+        return self.windowSums[channel] / size if size else None
+
+    def stats(self):
+        return [(self.getMin(channel), self.getMax(channel), self.getMean(channel)) for channel in range(self.channels)]
+
+    def clear(self):
+        self.total = 0
+        self.windowSums = [0.0] * self.channels
+        for queue in self.minQueues + self.maxQueues:
+            queue.clear()
@@ -0,0 +1,673 @@
+import itertools
+import math
+import os
+import random
+import select
+import struct
+
+import pytest
+
+from protocol import *
+from command_scheduler import SEQ_MODULO, CommandScheduler
+from route_planner import *
+from session import *
+from telemetry import TelemetryBuffer
+
+
+def test_frame_roundtrip():
+    """Тест кодирования и разбора кадров всех типов"""
+    parser = FrameParser()
+    data = encodeCommand((1, -2, 3, 1, 0), seq=7) + encodeDistances((1.5, 2.5, 3.5), seq=8) + encodeAck(9)
+
+    assert parser.feed(data) == [
+        (FRAME_COMMAND, 7, (1, -2, 3, 1, 0)),
+        (FRAME_DISTANCES, 8, (1.5, 2.5, 3.5)),
+        (FRAME_ACK, 9, ()),
+    ]
+    assert (parser.crcErrors, parser.droppedBytes, parser.badFrames) == (0, 0, 0)
+
+
+def test_frame_split_across_feeds():
+    """Тест кадров, разрезанных между порциями по одному байту"""
+    parser = FrameParser()
+    data = encodeDistances((10.0, 20.0, 30.0), seq=1) + encodeCommand((0, 0, 0, 1, 0), seq=2)
+    frames = []
+
+    for index in range(len(data)):
+        frames += parser.feed(data[index:index + 1])
+
+    assert frames == [(FRAME_DISTANCES, 1, (10.0, 20.0, 30.0)), (FRAME_COMMAND, 2, (0, 0, 0, 1, 0))]
+    assert not parser.buffer
+
+
+def test_frame_resync_after_garbage():
+    """Тест поиска начала кадра после мусора, в том числе похожего на SYNC"""
+    parser = FrameParser()
+    garbage = b"\x00\x01" + SYNC[:1] + b"\xff" + SYNC + b"\x02\x00\xff\xff"
+
+    assert parser.feed(garbage + encodeAck(3)) == [(FRAME_ACK, 3, ())]
+    assert parser.droppedBytes == len(garbage)
+    assert not parser.buffer
+
+    # Ложный SYNC с правдоподобной длиной ждёт данных, после ошибки CRC разбор сдвигается на байт
+    frames = parser.feed(SYNC + b"\x02\x00\x10\x00" + encodeAck(4))
+    readings = [encodeDistances((float(index), 0.0, 0.0), seq=index) for index in range(3)]
+    for reading in readings:
+        frames += parser.feed(reading)
+
+    assert frames[0] == (FRAME_ACK, 4, ())
+    assert frames[1:] == [(FRAME_DISTANCES, index, (float(index), 0.0, 0.0)) for index in range(3)]
+    assert parser.crcErrors == 1
+
+
+def test_frame_crc_error():
+    """Тест отбрасывания кадра с неверной CRC и разбора следующего"""
+    parser = FrameParser()
+    broken = bytearray(encodeDistances((1.0, 2.0, 3.0), seq=1))
+    broken[HEADER_SIZE] ^= 0xFF
+
+    assert parser.feed(bytes(broken) + encodeDistances((4.0, 5.0, 6.0), seq=2)) == [
+        (FRAME_DISTANCES, 2, (4.0, 5.0, 6.0)),
+    ]
+    assert parser.crcErrors == 1
+
+
+def test_frame_wrong_length_is_consumed():
+    """Тест кадров с целой CRC, но неверной для типа длиной, и кадров неизвестного типа"""
+    parser = FrameParser()
+    truncated = encodeFrame(FRAME_COMMAND, struct.pack("<3h", 1, 2, 3), seq=1)
+    unknown = encodeFrame(0x7F, struct.pack("<2f", 1.0, 2.0), seq=2)
+    oddDistances = encodeFrame(FRAME_DISTANCES, b"\x00" * 5, seq=3)
+    ackWithData = encodeFrame(FRAME_ACK, b"\x01", seq=4)
+
+    frames = parser.feed(truncated + unknown + oddDistances + ackWithData + encodeAck(5))
+
+    assert frames == [(FRAME_ACK, 5, ())]
+    assert parser.badFrames == 4
+    assert parser.crcErrors == 0
+    assert not parser.buffer
+
+
+def test_frame_ending_with_sync_byte():
+    """Тест кадра, CRC которого кончается байтом 0xA5: он не остаётся в буфере после разбора"""
+    frame = next(frame for frame in (encodeDistances((float(index), 0.0, 0.0), seq=1) for index in range(100000))
+                 if frame[-1:] == SYNC[:1])
+    parser = FrameParser()
+
+    assert len(parser.feed(frame)) == 1
+    assert not parser.buffer
+    assert parser.droppedBytes == 0
+
+    assert parser.feed(SYNC[:1]) == []
+    assert parser.buffer == SYNC[:1]
+    assert parser.droppedBytes == 0
+
+
+def test_frame_truncated_waits_for_rest():
+    """Тест неполного кадра: он остаётся в буфере до следующей порции"""
+    parser = FrameParser()
+    data = encodeCommand((5, 4, 3, 2, 1), seq=1)
+
+    assert parser.feed(data[:-3]) == []
+    assert parser.feed(data[-3:]) == [(FRAME_COMMAND, 1, (5, 4, 3, 2, 1))]
+
+
+def test_text_parser():
+    """Тест текстового протокола: неполные строки и ошибочные строки"""
+    parser = TextParser()
+
+    assert parser.feed(b"1.5,2,3\n4,") == [(FRAME_DISTANCES, 0, (1.5, 2.0, 3.0))]
+    assert parser.feed(b"5,6\r\nok\nabc\n\n") == [(FRAME_DISTANCES, 0, (4.0, 5.0, 6.0))]
+    assert parser.badLines == 2
+    assert not parser.buffer
+
+
+def test_encode_request():
+    """Тест выбора формата команды по протоколу"""
+    assert encodeRequest(PROTOCOL_TEXT, (0, 0, 0, 1, 0)) == b"0,0,0,1,0;"
+    assert FrameParser().feed(encodeRequest(PROTOCOL_BINARY, (0, 0, 0, 1, 0), seq=3)) == [
+        (FRAME_COMMAND, 3, (0, 0, 0, 1, 0)),
+    ]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_scheduler_window_ack_and_retry():
+    """Тест планировщика: окно команд, подтверждение по номеру, повтор с тем же номером и отказ"""
+    clock = FakeClock()
+    sent = []
+    failed = []
+    scheduler = CommandScheduler(lambda values, seq: sent.append((seq, values)), window=2, timeout=1.0,
+                                 retries=1, onFailed=lambda seq, values: failed.append((seq, values)), clock=clock)
+
+    scheduler.submitMany([(1, 0, 0, 0, 0), (2, 0, 0, 0, 0), (3, 0, 0, 0, 0)])
+    assert sent == [(0, (1, 0, 0, 0, 0)), (1, (2, 0, 0, 0, 0))]
+
+    # Окно в номерах: пока не подтверждён номер 0, номер 2 не выдаётся
+    assert scheduler.onAck(1) == 1
+    assert scheduler.onAck(7) is None
+    assert len(sent) == 2
+
+    clock.now = 1.0
+    scheduler.poll()
+    assert sent[-1] == (0, (1, 0, 0, 0, 0))
+
+    clock.now = 2.0
+    scheduler.poll()
+    assert failed == [(0, (1, 0, 0, 0, 0))]
+    assert sent[-1] == (2, (3, 0, 0, 0, 0))
+
+    scheduler.onAck(2)
+    assert scheduler.isIdle()
+    stats = scheduler.stats()
+    assert (stats["acked"], stats["retransmits"], stats["failed"], stats["unmatched"]) == (2, 1, 1, 1)
+
+
+def test_scheduler_stuck_command_stalls_seq_window():
+    """Тест зависшей команды: новые номера не уходят дальше окна от неё, после отказа отправка продолжается"""
+    clock = FakeClock()
+    sent = []
+    failed = []
+    scheduler = CommandScheduler(lambda values, seq: sent.append((seq, values)), window=4, timeout=1.0,
+                                 retries=1000, onFailed=lambda seq, values: failed.append((seq, values)), clock=clock)
+
+    stuck = (0, 0, 0, 1, 0)
+    scheduler.submit(stuck)
+    count = 3 * SEQ_MODULO
+    scheduler.submitMany((1, index, 0, 0, 0) for index in range(count))
+
+    for _ in range(10):
+        for seq, values in list(sent):
+            if seq != 0:
+                scheduler.onAck(seq)
+        clock.now += 1.0
+        scheduler.poll()
+
+    assert scheduler.inFlight[0][0] == stuck
+    assert sorted({seq for seq, _ in sent}) == [0, 1, 2, 3]
+    assert scheduler.acked == 3
+
+    scheduler.retries = 0
+    clock.now += 1.0
+    scheduler.poll()
+    assert failed == [(0, stuck)]
+
+    while not scheduler.isIdle():
+        scheduler.onAck(next(iter(scheduler.inFlight)))
+        assert max((scheduler.nextSeq - seq) % SEQ_MODULO for seq in scheduler.inFlight or [scheduler.nextSeq]) <= 4
+
+    firstSends = [(seq, values) for seq, values in sent if values != stuck]
+    assert [values for _, values in firstSends] == [(1, index, 0, 0, 0) for index in range(count)]
+    assert [seq for seq, _ in firstSends] == [(index + 1) % SEQ_MODULO for index in range(count)]
+    assert scheduler.acked == count
+
+
+def _readSegments(segments, channels):
+    timestamps = [timestamp for stamps, _ in segments for timestamp in stamps]
+    values = [value for _, segmentValues in segments for value in segmentValues]
+    return timestamps, [tuple(values[index:index + channels]) for index in range(0, len(values), channels)]
+
+
+def test_telemetry_wraparound():
+    """Тест кольцевого буфера: перезапись старых отсчётов и два сегмента после перехода через край"""
+    buffer = TelemetryBuffer(capacity=4, channels=2)
+
+    assert buffer.latest() is None
+    assert buffer.segments() == []
+
+    for index in range(6):
+        buffer.append((index, -index), timestamp=float(index))
+
+    assert len(buffer) == 4
+    assert buffer.latest() == (5.0, (5.0, -5.0))
+    assert len(buffer.segments()) == 2
+    assert _readSegments(buffer.segments(), 2) == (
+        [2.0, 3.0, 4.0, 5.0],
+        [(2.0, -2.0), (3.0, -3.0), (4.0, -4.0), (5.0, -5.0)],
+    )
+    assert _readSegments(buffer.segments(2), 2) == ([4.0, 5.0], [(4.0, -4.0), (5.0, -5.0)])
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.stats() == [(None, None, None), (None, None, None)]
+
+
+def test_telemetry_window_stats_match_brute_force():
+    """Тест минимума, максимума и среднего окна против прямого подсчёта"""
+    generator = random.Random(1)
+    buffer = TelemetryBuffer(capacity=16, channels=3, window=5)
+    samples = []
+
+    for _ in range(200):
+        values = tuple(generator.uniform(-1000.0, 1000.0) for _ in range(3))
+        buffer.append(values)
+        samples.append(values)
+
+        window = samples[-5:]
+        assert buffer.windowSize() == len(window)
+
+        for channel in range(3):
+            column = [values[channel] for values in window]
+            assert buffer.getMin(channel) == min(column)
+            assert buffer.getMax(channel) == max(column)
+            assert math.isclose(buffer.getMean(channel), math.fsum(column) / len(column), abs_tol=1e-9)
+
+
+def test_telemetry_running_sum_does_not_drift():
+    """Тест пересчёта суммы окна: большое значение, вышедшее из окна, не оставляет ошибку округления"""
+    buffer = TelemetryBuffer(capacity=8, channels=1, window=3)
+
+    for value in (1e16, 1.0, 1.0, 1.0, 1.0, 1.0):
+        buffer.append((value,))
+
+    assert buffer.getMean(0) == 1.0
+
+
+def _randomPoints(generator, count, size=20):
+    return [(generator.randint(0, size), generator.randint(0, size)) for _ in range(count)]
+
+
+def _optimalLength(matrix):
+    others = range(1, len(matrix))
+    return min(routeLength((0,) + order, matrix) for order in itertools.permutations(others))
+
+
+def test_plan_route_is_optimal_on_small_instances():
+    """Тест маршрута против полного перебора: на малых задачах эвристика находит оптимум"""
+    generator = random.Random(2)
+
+    for count in range(2, 6):
+        for _ in range(50):
+            matrix = manhattanMatrix(_randomPoints(generator, count))
+            route = planRoute(matrix)
+
+            assert sorted(route.tolist()) == list(range(count))
+            assert route[0] == 0
+            assert math.isclose(routeLength(route, matrix), _optimalLength(matrix))
+
+
+def test_plan_route_close_to_optimum():
+    """Тест маршрута на 6-8 точках: не длиннее оптимума более чем на 10% и не хуже ближайшего соседа"""
+    generator = random.Random(3)
+
+    for count in range(6, 9):
+        for _ in range(20):
+            matrix = manhattanMatrix(_randomPoints(generator, count))
+            start = generator.randrange(count)
+            route = planRoute(matrix, start=start)
+
+            assert sorted(route.tolist()) == list(range(count))
+            assert route[0] == start
+            assert routeLength(route, matrix) <= routeLength(nearestNeighbourRoute(matrix, start), matrix) + EPSILON
+            assert routeLength(route, matrix) <= _optimalLength(matrix) * 1.1 + EPSILON
+
+
+def test_grid_distances_and_path_around_wall():
+    """Тест BFS по сетке: обход стены, недостижимые клетки и путь кратчайшей длины"""
+    grid = np.zeros((3, 5), dtype=int)
+    grid[0:2, 1] = BLOCKED
+    grid[0, 3] = grid[1, 4] = BLOCKED
+
+    distances = gridDistances(grid, (0, 0))
+    assert distances[0, 2] == 6
+    assert distances[0, 1] == -1
+    assert distances[0, 4] == -1
+
+    path = gridPath(grid, (0, 0), (0, 2))
+    assert path[0] == (0, 0) and path[-1] == (0, 2)
+    assert len(path) == distances[0, 2] + 1
+    assert all(grid[cell] == FREE for cell in path)
+    assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+
+    with pytest.raises(ValueError):
+        gridMatrix(grid, [(0, 0), (0, 4)])
+    with pytest.raises(ValueError):
+        gridPath(grid, (0, 0), (0, 4))
+
+
+def _runCommands(commands, start, grid=None):
+    """Исполняет команды как устройство: возвращает клетки, в которых был сделан замер."""
+    row, col = start
+    measured = []
+
+    for command in commands:
+        assert len(command) == COMMAND_FIELDS
+        dx, dy, unused, measure, unusedLast = command
+        assert unused == unusedLast == 0
+
+        if measure:
+            assert command == measureCommand()
+            measured.append((row, col))
+            continue
+
+        # Перемещение только по одной оси за команду
+        assert (dx == 0) != (dy == 0)
+        for _ in range(abs(dx)):
+            col += 1 if dx > 0 else -1
+            assert grid is None or grid[row, col] == FREE
+        for _ in range(abs(dy)):
+            row += 1 if dy > 0 else -1
+            assert grid is None or grid[row, col] == FREE
+
+    return measured, (row, col)
+
+
+def test_route_commands_field_layout():
+    """Тест команд маршрута: поля "a,b,c,d,e;", замер на каждой точке и возврат к старту"""
+    points = [(0, 0), (2, 3), (2, 0), (0, 3)]
+    route = [0, 3, 1, 2]
+    commands = routeCommands(route, points)
+
+    assert moveCommand(4, -2) == (4, -2, 0, 0, 0)
+    assert measureCommand() == (0, 0, 0, 1, 0)
+    assert commands[:2] == [(3, 0, 0, 0, 0), measureCommand()]
+
+    measured, end = _runCommands(commands, points[0])
+    assert measured == [points[index] for index in route[1:]]
+    assert end == points[0]
+
+    measured, end = _runCommands(routeCommands(route, points, closed=False), points[0])
+    assert measured == [points[index] for index in route[1:]]
+    assert end == points[route[-1]]
+
+
+def test_route_commands_on_grid():
+    """Тест команд по сетке: путь не заходит в занятые клетки, одинаковые шаги сливаются"""
+    grid = np.zeros((4, 5), dtype=int)
+    grid[0:3, 2] = BLOCKED
+    points = [(0, 0), (0, 4), (3, 1)]
+    route = planRoute(gridMatrix(grid, points))
+    commands = routeCommands(route, points, grid=grid)
+
+    measured, end = _runCommands(commands, points[route[0]], grid=grid)
+    assert measured == [points[index] for index in route[1:]]
+    assert end == points[route[0]]
+    assert all(a[:2] != b[:2] or a == measureCommand() for a, b in zip(commands, commands[1:]))
+
+
+def _readPort(fd, timeout=1.0):
+    """Читает всё, что придёт в порт за timeout после первой порции."""
+    data = bytearray()
+
+    while select.select([fd], [], [], timeout)[0]:
+        data += os.read(fd, 65536)
+        timeout = 0.05
+
+    return bytes(data)
+
+
+@pytest.fixture
+def crabSimulator():
+    from simulator import CrabSimulator
+
+    simulators = []
+
+    def create(*args, **kwargs):
+        simulators.append(CrabSimulator(*args, **kwargs))
+        return simulators[-1]
+
+    yield create
+
+    for item in simulators:
+        item.close()
+
+
+def test_simulator_text_commands(crabSimulator):
+    """Тест текстовых команд симулятора: разбор по ";", ответ на запрос расстояния, пропуск ошибочных"""
+    simulator = crabSimulator(PROTOCOL_TEXT, rate=0)
+
+    simulator.handleInput(b"1,0,0,0,0;0,0,0,1")
+    simulator.handleInput(b",0;abc;1,x,0,0,0;\n;")
+
+    assert simulator.commands == [(1, 0, 0, 0, 0), (0, 0, 0, 1, 0)]
+    assert simulator.badCommands == 2
+    assert not simulator.commandBuffer
+
+    parser = TextParser()
+    readings = parser.feed(_readPort(simulator.slave))
+    assert [(frameType, len(values)) for frameType, _, values in readings] == [(FRAME_DISTANCES, 3)]
+    assert parser.badLines == 0
+
+
+def test_simulator_binary_commands(crabSimulator):
+    """Тест двоичных команд симулятора: подтверждение с номером, показание по запросу, повтор не выполняется"""
+    simulator = crabSimulator(PROTOCOL_BINARY, rate=0)
+
+    simulator.handleInput(encodeCommand((1, 0, 0, 0, 0), seq=5) + encodeCommand((0, 0, 0, 1, 0), seq=6))
+    simulator.handleInput(encodeCommand((1, 0, 0, 0, 0), seq=5))
+
+    frames = FrameParser().feed(_readPort(simulator.slave))
+    assert [frame[:2] for frame in frames] == [(FRAME_ACK, 5), (FRAME_ACK, 6), (FRAME_DISTANCES, 1), (FRAME_ACK, 5)]
+    assert simulator.commands == [(1, 0, 0, 0, 0), (0, 0, 0, 1, 0)]
+
+
+def test_simulator_ignores_repeat_after_lost_ack(crabSimulator):
+    """
+    Тест потерянных подтверждений: на каждом круге номеров первое подтверждение номера 0 теряется,
+    пока выполняются остальные команды. Повтор не выполняется второй раз, новый номер 0 после круга выполняется
+    """
+    from command_scheduler import MAX_WINDOW
+
+    simulator = crabSimulator(PROTOCOL_BINARY, rate=0)
+    parser = FrameParser()
+    clock = FakeClock()
+    sent = []
+
+    def send(values, seq):
+        sent.append(seq)
+        simulator.handleInput(encodeCommand(values, seq))
+
+    scheduler = CommandScheduler(send, window=MAX_WINDOW, timeout=1.0, clock=clock)
+    commands = [(index % 7 + 1, 0, 0, 0, 0) for index in range(3 * SEQ_MODULO)]
+    zeroAcks = 0
+
+    scheduler.submitMany(commands)
+
+    while not scheduler.isIdle():
+        while select.select([simulator.slave], [], [], 0)[0]:
+            for frameType, seq, _ in parser.feed(os.read(simulator.slave, 65536)):
+                if seq == 0:
+                    zeroAcks += 1
+                    if zeroAcks % 2:
+                        continue
+                scheduler.onAck(seq)
+
+        clock.now += 1.0
+        scheduler.poll()
+
+    assert zeroAcks == 6
+    assert scheduler.retransmits == 3
+    assert scheduler.failed == 0
+    assert simulator.commands == commands
+    assert len(sent) == len(commands) + 3
+
+
+def test_simulator_survives_bad_command(crabSimulator):
+    """Тест потока симулятора: после ошибочной строки он продолжает отвечать"""
+    simulator = crabSimulator(PROTOCOL_TEXT, rate=0)
+    simulator.start()
+
+    os.write(simulator.slave, b"1,2,oops;")
+    os.write(simulator.slave, b"0,0,0,1,0;")
+    data = _readPort(simulator.slave)
+
+    assert simulator.thread.is_alive()
+    assert [frame[0] for frame in TextParser().feed(data)] == [FRAME_DISTANCES]
+    assert simulator.badCommands == 1
+
+
+def test_simulator_periodic_readings(crabSimulator):
+    """Тест периодической отправки показаний с заданной частотой"""
+    simulator = crabSimulator(PROTOCOL_BINARY, rate=200)
+    simulator.start(duration=0.3)
+    simulator.thread.join()
+
+    frames = FrameParser().feed(_readPort(simulator.slave, timeout=0.1))
+    assert len(frames) == simulator.sent
+    assert 30 <= simulator.sent <= 90
+    assert [seq for _, seq, _ in frames] == [(index + 1) & 0xFF for index in range(len(frames))]
+
+
+def test_session_record_and_read(tmp_path):
+    """Тест записи сессии: направление, данные и неубывающее время читаются обратно"""
+    path = tmp_path / "session.bin"
+    recorder = SessionRecorder(path)
+    records = [(DIRECTION_HOST, b"0,0,0,1,0;"), (DIRECTION_DEVICE, b"1.0,2.0,3.0\n"), (DIRECTION_DEVICE, b"")]
+
+    for direction, data in records:
+        recorder.write(direction, data)
+    recorder.close()
+
+    session = list(readSession(path))
+    assert [(direction, data) for _, direction, data in session] == records
+    assert [timestamp for timestamp, _, _ in session] == sorted(timestamp for timestamp, _, _ in session)
+
+
+def test_session_record_and_replay(tmp_path, crabSimulator):
+    """Тест записи обмена с симулятором и воспроизведения только данных устройства"""
+    from simulator import openPseudoPort, replaySession
+
+    path = tmp_path / "session.bin"
+    recorder = SessionRecorder(path)
+    simulator = crabSimulator(PROTOCOL_TEXT, rate=0, recorder=recorder)
+
+    simulator.handleInput(b"0,0,0,1,0;")
+    sent = _readPort(simulator.slave)
+    recorder.close()
+
+    directions = [direction for _, direction, _ in readSession(path)]
+    assert directions == [DIRECTION_HOST, DIRECTION_DEVICE]
+
+    master, slave, portName = openPseudoPort()
+    try:
+        replaySession(path, speed=100.0, master=master)
+        assert _readPort(slave) == sent
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+class FakeSerial:
+    """Замена QSerialPort: запоминает записанное и отдаёт подготовленные данные."""
+
+    def __init__(self, isOpen=True):
+        self.opened = isOpen
+        self.written = bytearray()
+        self.incoming = bytearray()
+
+    def isOpen(self):
+        return self.opened
+
+    def write(self, data):
+        self.written += data
+
+    def bytesAvailable(self):
+        return len(self.incoming)
+
+    def read(self, size):
+        data, self.incoming = bytes(self.incoming[:size]), self.incoming[size:]
+        return data
+
+
+@pytest.fixture
+def serialWorkerFactory():
+    QtCore = pytest.importorskip("PyQt5.QtCore")
+    pytest.importorskip("PyQt5.QtSerialPort")
+    from serial_worker import SerialWorker
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def create(protocol=PROTOCOL_BINARY, **kwargs):
+        worker = SerialWorker(protocol, refreshMs=25, **kwargs)
+        worker.serial = FakeSerial()
+        return worker
+
+    yield create
+    app.processEvents()
+
+
+@pytest.fixture
+def serialWorker(serialWorkerFactory):
+    return serialWorkerFactory()
+
+
+def test_serial_worker_command_queue(serialWorker):
+    """Тест очереди команд: команды из любого потока пишутся в порт по порядку с номерами"""
+    serialWorker.sendCommand((0, 0, 0, 1, 0))
+    serialWorker.sendCommands([(1, 0, 0, 0, 0), (2, 0, 0, 0, 0)])
+
+    frames = FrameParser().feed(bytes(serialWorker.serial.written))
+    assert frames == [
+        (FRAME_COMMAND, 0, (0, 0, 0, 1, 0)),
+        (FRAME_COMMAND, 1, (1, 0, 0, 0, 0)),
+        (FRAME_COMMAND, 2, (2, 0, 0, 0, 0)),
+    ]
+
+    serialWorker.serial = FakeSerial(isOpen=False)
+    serialWorker.sendCommand((3, 0, 0, 0, 0))
+    assert not serialWorker.serial.written
+    assert serialWorker.commands.empty()
+
+
+def test_serial_worker_text_commands_are_not_retransmitted(serialWorkerFactory):
+    """Тест текстового протокола: команды пишутся сразу и не повторяются, ответ-расстояние не подтверждение"""
+    clock = FakeClock()
+    worker = serialWorkerFactory(PROTOCOL_TEXT)
+    worker.scheduler.clock = clock
+
+    worker.sendCommands([(1, 0, 0, 0, 0), (0, 0, 0, 1, 0)])
+    worker.serial.incoming += b"1.0,2.0,3.0\n"
+    worker.readPort()
+
+    clock.now = 10.0
+    worker.scheduler.poll()
+
+    assert bytes(worker.serial.written) == b"1,0,0,0,0;0,0,0,1,0;"
+    assert worker.scheduler.isIdle()
+    assert worker.scheduler.stats()["retransmits"] == 0
+    assert worker.pending == [(FRAME_DISTANCES, 0, (1.0, 2.0, 3.0))]
+
+
+def test_serial_worker_batches_until_flush(serialWorker):
+    """Тест ограничения частоты обновлений: кадры копятся до таймера и уходят одной пачкой"""
+    batches = []
+    stats = []
+    serialWorker.samplesReady.connect(batches.append)
+    serialWorker.statsReady.connect(stats.append)
+
+    serialWorker.sendCommand((0, 0, 0, 1, 0))
+
+    for index in range(3):
+        serialWorker.serial.incoming += encodeDistances((float(index), 0.0, 0.0), seq=index)
+        serialWorker.readPort()
+    serialWorker.serial.incoming += encodeAck(0)
+    serialWorker.readPort()
+
+    assert batches == []
+
+    serialWorker.flush()
+    serialWorker.flush()
+
+    assert batches == [[(FRAME_DISTANCES, index, (float(index), 0.0, 0.0)) for index in range(3)]]
+    assert len(stats) == 1
+    assert stats[0]["acked"] == 1
+
+
+def test_serial_worker_timers(serialWorker):
+    """Тест таймеров воркера: обновление интерфейса с заданным периодом и проверка таймаутов команд"""
+    from serial_worker import POLL_MS
+
+    serialWorker.start()
+
+    assert serialWorker.timer.interval() == 25
+    assert serialWorker.timer.isActive()
+    assert serialWorker.pollTimer.interval() == POLL_MS
+
+    serialWorker.timer.stop()
+    serialWorker.pollTimer.stop()